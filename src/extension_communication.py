@@ -609,7 +609,7 @@ def update_provenance(node):
         for prov in node_prov_parents:  # B
             if isinstance(prov, _node.Value):
                 for prov_child in prov.provenance_parents:  # A
-                    if prov_child not in node_prov_parents:  # if A not in C prov list
+                    if prov_child not in node.provenance_parents_set:  # if A not in C prov list (CHANGED BY ME: set)
                         # Can happen, e.g., BP sends a message to CS. Even though we rebuild CS PDG,
                         # we may miss some provenance as we may only add them if we did not already
                         # compute a given value. This is a workaround to add the missing ones.
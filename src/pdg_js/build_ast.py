@@ -165,9 +165,9 @@ def create_node(dico, node_body, parent_node, cond=False, filename=''):
             node = _node.FunctionExpression(name=dico['type'], parent=parent_node)
         elif dico['type'] == 'ReturnStatement':
             node = _node.ReturnStatement(name=dico['type'], parent=parent_node)
-        elif dico['type'] in _node.STATEMENTS:
+        elif dico['type'] in _node.STATEMENTS_SET:
             node = _node.Statement(name=dico['type'], parent=parent_node)
-        elif dico['type'] in _node.VALUE_EXPR:
+        elif dico['type'] in _node.VALUE_EXPR_SET:
             node = _node.ValueExpr(name=dico['type'], parent=parent_node)
         elif dico['type'] == 'Identifier':
             node = _node.Identifier(name=dico['type'], parent=parent_node)
@@ -182,10 +182,10 @@ def create_node(dico, node_body, parent_node, cond=False, filename=''):
             # are alone. If we do not respect the initial syntax, Escodegen cannot built the
             # JS code back.
         node.filename = filename
-        ast_to_ast_nodes(dico, node)
+        ast_to_ast_nodes(dico, node, filename=filename)  # <== CHANGED BY ME (passes the filename on)
 
 
-def ast_to_ast_nodes(ast, ast_nodes=_node.Node('Program')):
+def ast_to_ast_nodes(ast, ast_nodes=_node.Node('Program'), filename=''):
     """
         Convert an AST to Node objects.
 
@@ -197,6 +197,9 @@ def ast_to_ast_nodes(ast, ast_nodes=_node.Node('Program')):
             Current Node to be built. Default: ast_nodes=Node('Program'). Beware, always call the
             function indicating the default argument, otherwise the last value will be used
             (because the default parameter is mutable).
+        - filename: str
+            Name of the file the AST was built from, stored in each Node (only to be given in the
+            recursive calls, the root of the AST contains the filename itself).
 
         -------
         Returns:
@@ -207,8 +210,8 @@ def ast_to_ast_nodes(ast, ast_nodes=_node.Node('Program')):
     if 'filename' in ast:
         filename = ast['filename']
         ast_nodes.set_attribute('filename', filename)
-    else:
-        filename = ''
+        ast_nodes.filename = filename  # <== ADDED BY ME
+    # else: <== CHANGED BY ME (was: `filename = ''`, i.e., only the children of the root got to know the filename)
 
     for k in ast:
         if k == 'filename' or k == 'loc' or k == 'range' or k == 'value' \
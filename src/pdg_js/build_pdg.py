@@ -16,7 +16,7 @@
 
 """
     Generation and storage of JavaScript PDGs. Possibility for multiprocessing (NUM_WORKERS
-    defined in utility_df.py).
+    defined in utility_df.py, or the num_workers parameter of the folder builders).
 """
 
 import os
@@ -231,7 +231,16 @@ def handle_one_pdg(root, js, store_pdgs):
 
 
 def worker(my_queue):
-    """ Worker """
+    """
+        Worker, one of the `num_workers` processes started by store_pdg_folder() / store_extension_pdg_folder().
+
+        Division of labor: the PDGs of separate files are independent of one another, so the driver only fills
+        my_queue with one task per file, in no particular order, and each worker takes tasks until the queue is
+        empty. Each file is then handled in a process of its own (cf. handle_one_pdg()), so that a crash (e.g.,
+        a segfault) while building one PDG only loses that file. Processes rather than threads, as building a
+        PDG is CPU-bound Python code (GIL). Memory is not capped per process (cf. limit_memory()), so the number
+        of workers should be chosen with the memory of the host in mind.
+    """
 
     while True:
         try:
@@ -242,7 +251,7 @@ def worker(my_queue):
             break
 
 
-def store_pdg_folder(folder_js):
+def store_pdg_folder(folder_js, num_workers=None, tune_gc=False):  # <== CHANGED BY ME (added num_workers, tune_gc)
     """
         Stores the PDGs of the JS files from folder_js.
 
@@ -250,6 +259,12 @@ def store_pdg_folder(folder_js):
         Parameter:
         - folder_js: str
             Path of the folder containing the files to get the PDG of.
+        - num_workers: int
+            Number of worker processes building PDGs in parallel, cf. worker();
+            None --> utility_df.NUM_WORKERS (1 by default); pass, e.g., os.cpu_count() to use all CPUs.
+        - tune_gc: bool
+            Whether to make the garbage collector of this process and of its workers cheaper, cf.
+            utility_df.tune_gc() (off by default as it affects the entire process).
     """
 
     start = timeit.default_timer()
@@ -268,7 +283,11 @@ def store_pdg_folder(folder_js):
         for js in files:
             my_queue.put([root, js, store_pdgs])
 
-    for _ in range(utility_df.NUM_WORKERS):
+    if num_workers is None:  # <== ADDED BY ME
+        num_workers = utility_df.NUM_WORKERS
+    if tune_gc:  # <== ADDED BY ME (before forking, so that the workers inherit it)
+        utility_df.tune_gc()
+    for _ in range(num_workers):  # <== CHANGED BY ME (was: range(utility_df.NUM_WORKERS))
         p = Process(target=worker, args=(my_queue,))
         p.start()
         print("Starting process")
@@ -280,8 +299,11 @@ def store_pdg_folder(folder_js):
     utility_df.micro_benchmark('Total elapsed time:', timeit.default_timer() - start)
 
 
-def store_extension_pdg_folder(extensions_path):
-    """ Stores the PDGs of all JS files contained in all extensions_path's folders. TO CALL"""
+def store_extension_pdg_folder(extensions_path, num_workers=None, tune_gc=False):  # <== CHANGED BY ME (added num_workers, tune_gc)
+    """
+        Stores the PDGs of all JS files contained in all extensions_path's folders. TO CALL
+        Uses num_workers worker processes and tunes the garbage collector if tune_gc, cf. store_pdg_folder().
+    """
 
     start = timeit.default_timer()
 
@@ -301,7 +323,11 @@ def store_extension_pdg_folder(extensions_path):
                 #                                                                        ''))):
                 my_queue.put([extension_path, component, extension_pdg_path])
 
-    for _ in range(utility_df.NUM_WORKERS):
+    if num_workers is None:  # <== ADDED BY ME
+        num_workers = utility_df.NUM_WORKERS
+    if tune_gc:  # <== ADDED BY ME (before forking, so that the workers inherit it)
+        utility_df.tune_gc()
+    for _ in range(num_workers):  # <== CHANGED BY ME (was: range(utility_df.NUM_WORKERS))
         p = Process(target=worker, args=(my_queue,))
         p.start()
         print("Starting process")
@@ -186,9 +186,9 @@ def control_flow(ast_nodes):
     """
 
     for child in ast_nodes.children:
-        if child.name in _node.EPSILON or child.name in _node.UNSTRUCTURED:
+        if child.name in _node.EPSILON_SET or child.name in _node.UNSTRUCTURED_SET:
             epsilon_statement_cf(child)
-        elif child.name in _node.CONDITIONAL:
+        elif child.name in _node.CONDITIONAL_SET:
             conditional_statement_cf(child)
         else:
             for grandchild in child.children:
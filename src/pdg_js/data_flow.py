@@ -125,8 +125,8 @@ def set_data_dep(begin_data_dep, identifier_node, scopes, nearest_statement=None
     if begin_data_dep.fun is not None:  # The beginning of the DF is a function
         function_def = begin_data_dep.fun
         how_called = identifier_node.parent
-        if how_called.name in _node.CALL_EXPR\
-                and how_called.children[0].id == identifier_node.id:
+        if how_called.name in _node.CALL_EXPR_SET\
+                and how_called.children[0] is identifier_node:
             # Case from handle_call_expr
             pass
         else:
@@ -186,7 +186,7 @@ def search_identifiers(node, id_list, tab, rec=True):
 
     if node.name == 'ObjectExpression':  # Only consider the object name, no properties
         pass
-    elif node.name in _node.CALL_EXPR:  # Don't want to go there, as param should not be detected
+    elif node.name in _node.CALL_EXPR_SET:  # Don't want to go there, as param should not be detected
         pass
     elif node.name == 'Identifier':
         """
@@ -454,7 +454,7 @@ def function_scope(node, scopes, id_list):
         for j in range(i + 1, last_scope_inx):
             # The 2 functions' scope could be separated, e.g., by a Branch_true scope
             if scopes[i].function is not None and scopes[j].function is not None:
-                if scopes[i].function.id == scopes[j].function.id:
+                if scopes[i].function is scopes[j].function:
                     rec += 1  # Count the number of identical Function scopes
 
     if rec < LIMIT_RETRAVERSE:  # To avoid infinite recursion if function called on itself
@@ -626,13 +626,13 @@ def merge_var_boolean_cf(current_scope, scope_true, scope_false):
 
         for node_true in scope_true.var_list:
             if node_false.attributes['name'] == node_true.attributes['name']\
-                    and node_false.id != node_true.id:  # The var was modified in >=1 branch
+                    and node_false is not node_true:  # The var was modified in >=1 branch
                 var_index = scope_true.get_pos_identifier(node_true)
-                if any(node_true.id == node.id for node in current_scope.var_list):
+                if any(node_true is node for node in current_scope.var_list):
                     logging.debug('The variable %s has been modified in the branch False',
                                   node_false.attributes['name'])
                     scope_true.update_var(var_index, node_false)
-                elif any(node_false.id == node.id for node in current_scope.var_list):
+                elif any(node_false is node for node in current_scope.var_list):
                     logging.debug('The variable %s has been modified in the branch True',
                                   node_true.attributes['name'])
                     # Already handled, as we work on var_list_true
@@ -813,7 +813,7 @@ def handle_function_params(def_param, call_param):
         setattr(call_param, 'fun_param_parents', [])
 
     # Links the function parameter definition site to the call site with a fun_param dependency
-    if call_param.id not in [el.id for el in def_param.fun_param_children]:  # Avoids duplicates
+    if all(call_param is not el for el in def_param.fun_param_children):  # Avoids duplicates
         def_param.fun_param_children.append(call_param)
         call_param.fun_param_parents.append(def_param)
 
@@ -956,7 +956,7 @@ def build_dfg_content(child, scopes, id_list, entry):
 
     ################################################################################################
 
-    elif child.name in _node.CALL_EXPR:
+    elif child.name in _node.CALL_EXPR_SET:
 
         scopes = df_scoping(child, scopes=scopes, id_list=id_list)[1]
         callee = child.children[0]
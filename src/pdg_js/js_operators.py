@@ -66,7 +66,7 @@ def get_node_value(node, initial_node=None, recdepth=0, recvisited=None):
         return compute_function_expression(node)
     if node.name == 'CallExpression' and isinstance(node.children[0], _node.FunctionExpression):
         return node.children[0].fun_name  # Function called; mapping to the function name if any
-    if node.name in _node.CALL_EXPR:
+    if node.name in _node.CALL_EXPR_SET:
         return compute_call_expression(node, initial_node=initial_node,
                                        recdepth=recdepth + 1, recvisited=recvisited)
     if node.name == 'ReturnStatement' or node.name == 'BlockStatement':
@@ -142,7 +142,7 @@ def get_node_computed_value(node, initial_node=None, keep_none=False, recdepth=0
                                recdepth=recdepth + 1, recvisited=recvisited)
         logging.debug('The value should be computed, got %s', value)
 
-    if isinstance(node, _node.Value) and node.name not in _node.CALL_EXPR:
+    if isinstance(node, _node.Value) and node.name not in _node.CALL_EXPR_SET:
         # Do not store value for CallExpr as could have changed and should be recomputed
         node.set_value(value)  # Stores the value so as not to compute it again
 
@@ -415,7 +415,7 @@ def compute_call_expression(node, initial_node, recdepth=0, recvisited=None):
         return value
         # return compute_member_expression(callee) + params  # To test if problems here
 
-    if callee.name in _node.CALL_EXPR:
+    if callee.name in _node.CALL_EXPR_SET:
         if get_node_computed_value(callee, initial_node=initial_node, recdepth=recdepth + 1,
                                    recvisited=recvisited) is None or params is None:
             return None
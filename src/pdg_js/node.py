@@ -34,17 +34,18 @@
 
 import logging
 import math
-import random
 import itertools
 import os
 import re
+import sys
 import statistics
 import tempfile
 import timeit
 import base64
-from collections import defaultdict
-from functools import total_ordering
-from typing import Set, Tuple, Optional, Self, List, Any, Dict, DefaultDict, Callable
+import bisect
+from collections import defaultdict, Counter
+from functools import cache, lru_cache
+from typing import Set, Tuple, Optional, Self, List, Any, Dict, DefaultDict, Callable, Iterator
 
 from . import utility_df
 from .LHSException import LHSException
@@ -74,14 +75,502 @@ CALL_EXPR = ['CallExpression', 'TaggedTemplateExpression', 'NewExpression']
 VALUE_EXPR = ['Literal', 'ArrayExpression', 'ObjectExpression', 'ObjectPattern'] + CALL_EXPR
 COMMENTS = ['Line', 'Block']
 
+# ADDED BY ME: frozenset versions of the Node name lists above, for O(1) `node.name in ...` checks instead of scanning
+#              a list (the lists themselves are kept as they are, as callers also concatenate them, e.g., `CALL_EXPR + [...]`):
+EXPRESSIONS_SET = frozenset(EXPRESSIONS)
+EPSILON_SET = frozenset(EPSILON)
+CONDITIONAL_SET = frozenset(CONDITIONAL)
+UNSTRUCTURED_SET = frozenset(UNSTRUCTURED)
+STATEMENTS_SET = frozenset(STATEMENTS)
+CALL_EXPR_SET = frozenset(CALL_EXPR)
+VALUE_EXPR_SET = frozenset(VALUE_EXPR)
+COMMENTS_SET = frozenset(COMMENTS)
+
 GLOBAL_VAR = ['window', 'this', 'self', 'top', 'global', 'that']
 
 LIMIT_SIZE = utility_df.LIMIT_SIZE  # To avoid list values with over 1,000 characters
 
+# ADDED BY ME: the maximum number of children that Node.child() allows for certain Nodes:
+_MAX_CHILDREN = {
+    "BinaryExpression": 2,
+    "LogicalExpression": 2,
+    "AssignmentExpression": 2,
+    "UnaryExpression": 1,
+    "UpdateExpression": 1,
+    "IfStatement": 3,
+}
+
+# ADDED BY ME: the Nodes that can be the scope of a FunctionDeclaration, cf. Node.function_declaration_get_scope():
+_FUNCTION_SCOPE_NAMES = frozenset(["FunctionDeclaration", "FunctionExpression", "ArrowFunctionExpression", "Program"])
+
+_PERMUTATIONS_OF_3 = tuple(itertools.permutations(range(3)))  # <== ADDED BY ME; used by Node.matches()
+
+# ADDED BY ME: Most Nodes never get any children or statement/control/data dependencies or provenance, so they all share
+#              this immutable empty container (instead of empty lists/sets of their own); the mutators replace it
+#              with a list/set on first use. (The empty tuple stays a singleton when unpickled, an empty frozenset not.)
+_EMPTY_TUPLE = ()
+
+# ADDED BY ME: the attributes whose (string) values are interned, as they are compared/looked up constantly, e.g., by
+#              matches() or by identifiers_by_name (interning also keeps only one copy of "window", "this", etc.):
+_INTERNED_ATTRIBUTES = frozenset(['name', 'operator'])
+
+# ADDED BY ME: the attributes shown by str(node), by Node name:
+_STR_ATTRIBUTES_OF_INTEREST: Dict[str, str | List[str]] = {
+    "Identifier": 'name',
+    "Literal": ['raw', 'value', 'regex'],  # note that 'regex' is an optional attribute of a Literal!
+    "TemplateElement": ['value'],
+    "BinaryExpression": 'operator',      # 'instanceof' | 'in' | '+' | '-' | '*' | '/' | '%' | '**' |
+                                         # '|' | '^' | '&' | '==' | '!=' | '===' | '!==' |
+                                         # '<' | '>' | '<=' | '<<' | '>>' | '>>>'
+    "LogicalExpression": 'operator',     # || or &&
+    "AssignmentExpression": 'operator',  # '=' | '*=' | '**=' | '/=' | '%=' | '+=' | '-=' |
+                                         # '<<=' | '>>=' | '>>>=' | '&=' | '^=' | '|='
+    "UnaryExpression": 'operator',       # '+' | '-' | '~' | '!' | 'delete' | 'void' | 'typeof'
+    "UpdateExpression": 'operator',      # '++' or '--'
+    "MemberExpression": 'computed',      # (boolean)  # ToDo: handle True/False cases differently in code (x.y vs. x[y])
+    "FunctionExpression": ['generator', 'async', 'expression'],  # (all booleans)
+    "VariableDeclaration": 'kind',       # 'var' | 'const' | 'let'
+    "Property": ['computed', 'method', 'shorthand'],
+    "MethodDefinition": ['computed', 'kind', 'static'],
+}
+
+# ADDED BY ME: the kinds of ancestors each Node in a TreeIndex remembers (as a bitset), to answer "is inside a ...?"
+#              questions like Node.is_inside_return_statement() without walking up the tree:
+_ANCESTOR_KIND_BITS: Dict[str, int] = {
+    name: 1 << bit for bit, name in enumerate([
+        "ReturnStatement", "IfStatement", "FunctionDeclaration", "FunctionExpression", "ArrowFunctionExpression",
+    ])
+}
+
+# ADDED BY ME: the bits of Node._pattern_flags, only ever set for the Nodes of patterns (cf. Node.wildcard(),
+#              Node.identifier_regex() and Node.string_literal_regex()), all other Nodes have _pattern_flags == 0:
+_WILDCARD = 1 << 0
+_IDENTIFIER_REGEX = 1 << 1
+_STRING_LITERAL_REGEX = 1 << 2
+_NEGATED_STRING_LITERAL_REGEX = 1 << 3
+
+# ADDED BY ME: which attribute Node.get_node_attributes() returns:
+_ATTR_KIND_UNKNOWN, _ATTR_KIND_NONE, _ATTR_KIND_REGEX, _ATTR_KIND_VALUE_RAW, _ATTR_KIND_VALUE, _ATTR_KIND_NAME = range(6)
+
+
+# ADDED BY ME:
+@cache
+def _compiled_regex(regex: str | re.Pattern) -> re.Pattern:
+    """
+    Returns `re.compile(regex)`. Cached without bound, as the regexes used (by patterns in particular) are few but
+    matched over and over again; this saves the lookup in the cache of the re module on each match.
+    An already compiled `regex` is returned as is (by re.compile() as well), so callers may pass either.
+    """
+    return re.compile(regex)
+
+
+# ADDED BY ME:
+@cache
+def _prefixes_by_length(prefixes: Tuple[str, ...]) -> Tuple[Tuple[int, frozenset], ...]:
+    """
+    Groups the given prefixes (e.g., the APIs of Node.get_sensitive_apis_accessed()) by length, such that the prefixes
+    a string starts with are found using one set lookup per distinct prefix length (`string[:length] in prefixes`)
+    instead of one str.startswith() call per prefix.
+    """
+    by_length: DefaultDict[int, Set[str]] = defaultdict(set)
+    for prefix in prefixes:
+        by_length[len(prefix)].add(prefix)
+    return tuple((length, frozenset(prefixes_of_length)) for length, prefixes_of_length in sorted(by_length.items()))
+
+
+# ADDED BY ME:
+def _pattern_flag_property(bit: int) -> property:
+    """ A boolean property of a Node, stored as the given bit of its `_pattern_flags`. """
+    def get_flag(self) -> bool:
+        return (self._pattern_flags & bit) != 0
+
+    def set_flag(self, value: bool):
+        if value:
+            self._pattern_flags |= bit
+        else:
+            self._pattern_flags &= ~bit
+
+    return property(get_flag, set_flag)
+
+
+# ADDED BY ME:
+def _identifier_matches(node, pattern) -> bool:
+    """ The Identifier-specific part of Node.matches(), only relevant when match_identifier_names=True. """
+    if pattern.is_identifier_regex:
+        return _compiled_regex(pattern.attributes['name']).fullmatch(node.attributes['name']) is not None
+    else:
+        return pattern.attributes['name'] == node.attributes['name']
+
+
+# ADDED BY ME:
+def _literal_matches(node, pattern) -> bool:
+    """
+    The Literal-specific part of Node.matches(), only relevant when match_literals=True.
+    Note that the "value" (not the "raw") attributes are compared.
+    """
+    if pattern.is_string_literal_regex:
+        return _compiled_regex(pattern.attributes['value']).fullmatch(node.attributes['value']) is not None
+    elif pattern.is_negated_string_literal_regex:
+        return _compiled_regex(pattern.attributes['value']).fullmatch(node.attributes['value']) is None
+    else:
+        return node.attributes['value'] == pattern.attributes['value']
+
+
+# ADDED BY ME:
+def _operator_matches(node, pattern) -> bool:
+    """ The part of Node.matches() specific to Nodes with an 'operator' attribute, only relevant when match_operators=True. """
+    return node.attributes['operator'] == pattern.attributes['operator']
+
+
+_OPERATOR_NODE_NAMES = ["UpdateExpression", "UnaryExpression", "BinaryExpression",
+                        "LogicalExpression", "AssignmentExpression"]  # <== ADDED BY ME
+
+
+# ADDED BY ME:
+def _get_match_predicates(match_identifier_names: bool,
+                          match_literals: bool,
+                          match_operators: bool) -> Dict[str, Callable[[Any, Any], bool]]:
+    """
+    Returns the Node-kind-specific checks Node.matches() has to perform for the given arguments, by Node name.
+    Nodes whose name is not in the returned dict are compared structurally only.
+    """
+    predicates = dict()
+    if match_identifier_names:
+        predicates["Identifier"] = _identifier_matches
+    if match_literals:
+        predicates["Literal"] = _literal_matches
+    if match_operators:
+        for operator_node_name in _OPERATOR_NODE_NAMES:
+            predicates[operator_node_name] = _operator_matches
+    return predicates
+
+
+# ADDED BY ME: the result of _get_match_predicates() for each flags tuple of Node._matches(), computed upfront, so
+#              that Node.matches() specializes on its boolean arguments once, instead of testing them on every Node:
+_MATCH_PREDICATES_BY_FLAGS: Dict[Tuple[bool, bool, bool, bool, bool], Dict[str, Callable[[Any, Any], bool]]] = {
+    flags: _get_match_predicates(*flags[:3])
+    for flags in itertools.product([False, True], repeat=5)
+}
+
+# ADDED BY ME: the Node-kind-specific checks of Node.equivalent(), i.e., of matches() with all match_* arguments True:
+_EQUIVALENCE_PREDICATES = _MATCH_PREDICATES_BY_FLAGS[(True, True, True, False, False)]
+
+
+# ADDED BY ME:
+def _new_match_memo(allow_additional_children: bool, allow_different_child_order: bool) -> Optional[dict]:
+    """
+    Returns the memo for a call to Node.matches() or Node.find_pattern(), cf. `Node._matches(flags, memo)`.
+
+    When neither additional children nor a different child order are allowed, each child is only ever compared to the
+    pattern child at the same position, so no pair of (sub)tree and (sub)pattern is compared twice (not even across
+    nested match candidates, as the depth of the subpattern determines the candidate); None is returned then, to
+    save the memo's hashing overhead.
+    """
+    if allow_additional_children or allow_different_child_order:
+        return dict()
+    return None
+
+
+# ADDED BY ME:
+def _exists_child_assignment(children, pattern_children, flags: tuple, memo: dict) -> bool:
+    """
+    Used by Node.matches() when the order of children doesn't matter:
+    Returns whether each of the `pattern_children` can be assigned a *different* one of the `children` that matches
+    it (cf. `Node._matches(flags, memo)`), i.e., whether there is a matching in the bipartite "matches" graph that
+    covers all pattern children.
+
+    Uses Kuhn's augmenting path algorithm, i.e., O(len(children) * len(pattern_children)) comparisons at most
+    (each pair is compared only once, lazily, as the results are memoized in `memo`), instead of trying all
+    len(children)! permutations.
+    Wildcard pattern children match any child, so only the other pattern children take part in the matching; the
+    wildcards are then assigned the remaining children, of which there are enough iff len(children) is large enough.
+    """
+    no_children = len(children)
+    if no_children < len(pattern_children):
+        return False
+    pattern_child_of_child: List[int] = [-1] * no_children  # -1 = child isn't assigned to any pattern child yet
+
+    def assign(j: int, visited: List[bool]) -> bool:  # try to find an augmenting path starting at pattern child j
+        for i in range(no_children):
+            if not visited[i] and children[i]._matches(pattern_children[j], flags, memo):
+                visited[i] = True
+                if pattern_child_of_child[i] == -1 or assign(pattern_child_of_child[i], visited):
+                    pattern_child_of_child[i] = j
+                    return True
+        return False
+
+    return all(assign(j, [False] * no_children) for j in range(len(pattern_children))
+               if not pattern_children[j]._pattern_flags & _WILDCARD)
+
+
+# ADDED BY ME:
+def _exists_ordered_child_embedding(children, pattern_children, flags: tuple, memo: dict) -> bool:
+    """
+    Used by Node.matches() when additional children are allowed but the order of children matters:
+    Returns whether the non-wildcard `pattern_children` match a subsequence of the `children` (cf.
+    `Node._matches(flags, memo)`), i.e., whether they can be assigned to children in the same relative order.
+    The wildcard pattern children (just like the wildcards the pattern would otherwise be filled up with) are then
+    matched by any of the remaining children, as long as there are at least as many children as pattern children.
+
+    Assigning each pattern child greedily to the first matching child after the previous one suffices: if there is
+    any such assignment at all, the greedy one is one as well. This takes O(len(children) * len(pattern_children))
+    comparisons at most, instead of trying all len(children)! permutations of the pattern filled up with wildcards.
+    """
+    if len(children) < len(pattern_children):
+        return False
+    children_iter = iter(children)
+    return all(any(child._matches(pattern_child, flags, memo) for child in children_iter)
+               for pattern_child in pattern_children
+               if not pattern_child._pattern_flags & _WILDCARD)
+
+
+# ADDED BY ME:
+class TreeIndex:
+    """
+    An index over all the Nodes of a tree, built (lazily) for its root Node, cf. Node.get_index().
+
+    Stores, for each Node name, the list of all Nodes with that name in pre-order, together with their pre-order
+    positions. Each indexed Node remembers its own pre-order position (`_pre_order_no`) and the position right after
+    its last descendant (`_subtree_end`), so that the Nodes of a given name inside any subtree form a contiguous
+    slice of these lists, found by binary search.
+    Each indexed Node also remembers the first Literal of its subtree in pre-order (`_first_literal`, None if there
+    is none), as contains_literal() and get_literal_raw() are asked for that so often, and which kinds of Nodes
+    (cf. _ANCESTOR_KIND_BITS) occur among its ancestors (`_ancestor_kinds`, a bitset).
+    The Identifiers are additionally bucketed by their name, in the same manner, cf. get_identifier_range(), and
+    the string Literals are kept in a list of their own, cf. get_string_literal_range().
+    The FunctionDeclarations are bucketed by name and scope on demand, cf. get_function_declarations_by_scope(),
+    remembering the scope of each of them, cf. get_function_declaration_scope().
+    """
+
+    _generations = itertools.count()
+
+    def __init__(self, root):
+        self.generation = next(TreeIndex._generations)  # (tells apart the successive indices of the same root)
+
+        # Pre-order traversal:
+        nodes = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+
+        # Subtree sizes, heights and first Literals (children come after their parent in pre-order, so do it in
+        #   reverse); the heights are stored in the cache of Node.get_height(), refreshing it:
+        subtree_sizes = dict()
+        for node in reversed(nodes):
+            subtree_sizes[id(node)] = 1 + sum(subtree_sizes[id(child)] for child in node.children)
+            node.height = 1 + max([child.height for child in node.children], default=0)
+            if node.name == "Literal":
+                node._first_literal = node
+            else:
+                node._first_literal = next((child._first_literal for child in node.children
+                                            if child._first_literal is not None), None)
+
+        self.nodes_by_name: Dict[str, List[Node]] = defaultdict(list)
+        self.positions_by_name: Dict[str, List[int]] = defaultdict(list)
+        self.identifiers_by_name: Dict[str, List[Node]] = defaultdict(list)
+        self.identifier_positions_by_name: Dict[str, List[int]] = defaultdict(list)
+        self.string_literals: List[Node] = []
+        self.string_literal_positions: List[int] = []
+        self.function_declarations_by_name: Optional[Dict[str, Dict[Node, List[Node]]]] = None  # (built lazily)
+        self.function_declaration_scopes: Optional[Dict[Node, Node]] = None  # (built lazily, together with the above)
+        root._ancestor_kinds = 0
+        for position, node in enumerate(nodes):
+            node._index_root = root
+            node._index_generation = self.generation
+            node._pre_order_no = position
+            node._subtree_end = position + subtree_sizes[id(node)]
+            # Parents come before their children in pre-order:
+            kinds_below = node._ancestor_kinds | _ANCESTOR_KIND_BITS.get(node.name, 0)
+            for child in node.children:
+                child._ancestor_kinds = kinds_below
+            self.nodes_by_name[node.name].append(node)
+            self.positions_by_name[node.name].append(position)
+            if node.name == "Identifier":
+                identifier_name = node.attributes.get('name')
+                self.identifiers_by_name[identifier_name].append(node)
+                self.identifier_positions_by_name[identifier_name].append(position)
+            elif node.name == "Literal" and _is_string_literal_raw(node.attributes.get('raw')):
+                self.string_literals.append(node)
+                self.string_literal_positions.append(position)
+        self.nodes_by_name = dict(self.nodes_by_name)
+        self.positions_by_name = dict(self.positions_by_name)
+        self.identifiers_by_name = dict(self.identifiers_by_name)
+        self.identifier_positions_by_name = dict(self.identifier_positions_by_name)
+
+    def get_range(self, node: "Node", node_name: str) -> Tuple[List["Node"], int, int]:
+        """
+        Returns `(nodes, lo, hi)` such that `nodes[lo:hi]` are all the Nodes named `node_name` inside the subtree
+        rooted at `node` (including `node` itself), in pre-order.
+        """
+        return TreeIndex._get_range(node, self.nodes_by_name, self.positions_by_name, node_name)
+
+    def get_identifier_range(self, node: "Node", identifier_name: str) -> Tuple[List["Node"], int, int]:
+        """
+        Like get_range() but for the Identifiers named `identifier_name` (i.e., `attributes['name']`) inside the
+        subtree rooted at `node`.
+        """
+        return TreeIndex._get_range(node, self.identifiers_by_name, self.identifier_positions_by_name, identifier_name)
+
+    def get_string_literal_range(self, node: "Node") -> Tuple[List["Node"], int, int]:
+        """
+        Like get_range() but for the string Literals (cf. _is_string_literal_raw()) inside the subtree rooted at `node`.
+        """
+        positions = self.string_literal_positions
+        lo = bisect.bisect_left(positions, node._pre_order_no)
+        hi = bisect.bisect_left(positions, node._subtree_end, lo)
+        return self.string_literals, lo, hi
+
+    def get_function_declarations_by_scope(self, function_name: str) -> Dict["Node", List["Node"]]:
+        """
+        Returns all the FunctionDeclarations of the tree declaring a function named `function_name`, grouped by their
+        scope (cf. Node.function_declaration_get_scope()), each group in pre-order.
+        Computed for all names at once on the first call, as Node.function_Identifier_get_FunctionDeclaration() is
+        called for one function call Identifier after the other.
+        """
+        if self.function_declarations_by_name is None:
+            self._index_function_declarations()
+        return self.function_declarations_by_name.get(function_name, dict())
+
+    def get_function_declaration_scope(self, function_declaration: "Node") -> "Node":
+        """
+        Returns the scope of the given FunctionDeclaration of the tree, cf. Node.function_declaration_get_scope().
+        """
+        if self.function_declaration_scopes is None:
+            self._index_function_declarations()
+        return self.function_declaration_scopes[function_declaration]
+
+    def _index_function_declarations(self):
+        """ Cf. get_function_declarations_by_scope() and get_function_declaration_scope(). """
+        function_declarations_by_name: Dict[str, Dict[Node, List[Node]]] = dict()
+        function_declaration_scopes: Dict[Node, Node] = dict()
+        for function_declaration in self.nodes_by_name.get("FunctionDeclaration", []):
+            scope = function_declaration_scopes[function_declaration] =\
+                function_declaration._function_declaration_get_scope_uncached()
+            function_declarations_by_name\
+                .setdefault(function_declaration.function_declaration_get_name(), dict())\
+                .setdefault(scope, [])\
+                .append(function_declaration)
+        self.function_declarations_by_name = function_declarations_by_name
+        self.function_declaration_scopes = function_declaration_scopes
+
+    @staticmethod
+    def _get_range(node: "Node",
+                   nodes_by_key: Dict[str, List["Node"]],
+                   positions_by_key: Dict[str, List[int]],
+                   key: str) -> Tuple[List["Node"], int, int]:
+        positions = positions_by_key.get(key)
+        if positions is None:
+            return [], 0, 0
+        lo = bisect.bisect_left(positions, node._pre_order_no)
+        hi = bisect.bisect_left(positions, node._subtree_end, lo)
+        return nodes_by_key[key], lo, hi
+
+
+# ADDED BY ME:
+def _is_string_literal_raw(raw: Any) -> bool:
+    """
+    Whether the given 'raw' attribute of a Literal is the one of a (correct) string literal, i.e., whether it's
+    enclosed in double or single quotation marks. (Template strings aren't Literals, cf. TemplateLiteral.)
+    """
+    return type(raw) is str and raw != "" and raw[0] == raw[-1] and raw[0] in ('"', "'")
+
+
+# ADDED BY ME:
+def _expand_data_flow_parents(frontier: List["Node"], seen: Set["Node"]) -> List["Node"]:
+    """
+    One round of a breadth-first search along the data flow parents of the Identifiers in `frontier`.
+    Adds the data flow parents not `seen` before to `seen` and returns them as the next frontier.
+    """
+    new_frontier = []
+    seen_add = seen.add  # (bound methods looked up once, this is the innermost loop of all data flow closures)
+    new_frontier_append = new_frontier.append
+    for identifier in frontier:
+        for data_dep_parent in identifier.data_dep_parents():
+            parent = data_dep_parent.extremity
+            if parent not in seen:
+                seen_add(parent)
+                new_frontier_append(parent)
+    return new_frontier
+
+
+# ADDED BY ME:
+def _new_id_counter() -> Iterator[int]:
+    """
+    The source of Node IDs for the current process: consecutive integers, starting at the process ID shifted left by
+    40 bits (IDs of Nodes created in different processes will therefore only collide after 2**40 Nodes).
+    """
+    return itertools.count((os.getpid() & 0xFFFF) << 40)
+
+
+# ADDED BY ME:
+def _reset_id_counter():
+    Node._id_counter = _new_id_counter()
+
+
+# ADDED BY ME:
+def same_id(node1: Optional["Node"], node2: Optional["Node"]) -> bool:
+    """
+    Whether the two given Nodes have the same ID, i.e., whether they are copies of the same Node, even though they may
+    be different objects: `==` only holds for the very same object (cf. Node.__eq__), so use this instead to compare
+    Nodes across (un)pickled copies of a PDG, e.g., a PDG loaded by get_pdg.unpickle_pdg() with the PDG it was stored
+    from, or Nodes sent between processes (IDs are unique across processes, cf. _new_id_counter()).
+    """
+    if node1 is None or node2 is None:
+        return node1 is node2
+    return node1.id == node2.id
+
+
+# ADDED BY ME (was defined inside of Node.code_occurrence()):
+class CodeOccurrence:
+    """
+    The start position of a Node in code, cf. Node.code_occurrence(); comparable using <, <=, >, >=, ==, != operators.
+    Only a wrapper around the packed integer returned by Node._get_start_pos(), so that sorting Nodes by their code
+    occurrence compares plain integers.
+    """
+
+    __slots__ = ("start_pos",)
+
+    def __init__(self, start_pos: int):
+        self.start_pos = start_pos
+
+    @property
+    def line(self) -> int:
+        return self.start_pos >> 32
+
+    @property
+    def column(self) -> int:
+        return self.start_pos & 0xFFFFFFFF
+
+    def __eq__(self, other):
+        if other is None:
+            return False
+        return self.start_pos == other.start_pos
+
+    def __lt__(self, other):  # implements the "<" operator; cf. logic in occurs_in_code_before()
+        return self.start_pos < other.start_pos
+
+    # ADDED BY ME (were derived by @total_ordering, at the cost of an extra Python-level call each):
+    def __le__(self, other):
+        return self.start_pos <= other.start_pos
+
+    def __gt__(self, other):
+        return self.start_pos > other.start_pos
+
+    def __ge__(self, other):
+        return self.start_pos >= other.start_pos
+
+    def __hash__(self):
+        return hash(self.start_pos)
+
 
 class Dependence:
     """ For control, data, comment, and statement dependencies. """
 
+    # ADDED BY ME: there are (two) Dependence objects for each dependency edge, i.e., even more than there are Nodes:
+    __slots__ = ("type", "extremity", "nearest_statement", "label")
+
     def __init__(self, dependency_type, extremity, label, nearest_statement=None):
         self.type = dependency_type
         self.extremity = extremity
@@ -92,26 +581,70 @@ class Dependence:
 class Node:
     """ Defines a Node that is used in the AST. """
 
-    id = random.randint(0, 2*32)  # To limit id collision between 2 ASTs from separate processes
+    # <== CHANGED BY ME: was `id = random.randint(0, 2*32)`, incremented by each __init__(); to limit id collision
+    #                    between 2 ASTs from separate processes, the ids are now prefixed by the process ID instead:
+    _id_counter = _new_id_counter()
+
+    # ADDED BY ME: incremented whenever the structure of any tree changes (cf. _children_changed() and
+    #              _invalidate_index(), the latter also covering set_parent()); together with
+    #              Identifier._data_flow_version, this tells whether a result cached by _cached_string_form() (or by
+    #              member_expression_get_leftmost_identifier()) is stale:
+    _structure_version = 0
+
+    # ADDED BY ME: ASTs easily consist of hundreds of thousands of Nodes, so don't give each of them a __dict__.
+    #              Note that the subclasses have to declare the attributes of their other base class (Value or
+    #              Function) in their own __slots__, as only one base class may have non-empty __slots__.
+    __slots__ = (
+        "name", "_is_statement", "id", "filename", "attributes", "body", "body_list", "parent", "children",
+        "statement_dep_parents", "statement_dep_children",
+        "_pattern_flags",
+        "identifiers_by_name", "height", "_attr_kind",
+        "_index", "_index_root", "_index_generation", "_pre_order_no", "_subtree_end", "_first_literal",
+        "_ancestor_kinds", "_child_names", "_sorted_child_names", "_non_wildcard_child_names",
+        "_start_pos", "_end_pos", "_string_form_cache", "_leftmost_identifier_cache",
+        # Only set for some Nodes (and tested for using hasattr()), cf. data_flow.py and extension_communication.py:
+        "fun_param_parents", "fun_param_children", "flow_parents", "flow_children", "onconnectexternal",
+        "__weakref__",
+    )
 
     def __init__(self, name, parent=None, attributes=None):
-        self.name = name
-        self.id = Node.id
-        Node.id += 1
+        self.name = sys.intern(name)  # <== CHANGED BY ME; interned, as Node names are compared/looked up constantly
+        self._is_statement = self.name in STATEMENTS_SET  # <== ADDED BY ME; used by get_statement()
+        self.id = next(Node._id_counter)  # <== CHANGED BY ME
         self.filename = ''
-        self.attributes = {} if attributes is None else attributes
+        self.attributes = {} if attributes is None else _intern_attributes(attributes)  # <== CHANGED BY ME
         self.body = None  # ADDED BY ME: e.g., "id", "params", "left", "right", etc.
         self.body_list = False
         self.parent = parent
-        self.children = []
-        self.statement_dep_parents = []
-        self.statement_dep_children = []  # Between Statement and their non-Statement descendants
-        self.is_wildcard = False  # <== ADDED BY ME
-        self.is_identifier_regex = False  # <== ADDED BY ME
-        self.is_string_literal_regex = False  # <== ADDED BY ME
-        self.is_negated_string_literal_regex = False  # <== ADDED BY ME
+        self.children = _EMPTY_TUPLE  # <== CHANGED BY ME (copy-on-write, cf. _children_changed()); most Nodes are leaves
+        self.statement_dep_parents = _EMPTY_TUPLE  # <== CHANGED BY ME (copy-on-write)
+        self.statement_dep_children = _EMPTY_TUPLE  # Between Statement and their non-Statement descendants
+        self._pattern_flags = 0  # <== ADDED BY ME; cf. is_wildcard, is_identifier_regex, etc. below
         self.identifiers_by_name: Optional[Dict[str, List[Node]]] = None  # <== ADDED BY ME (shall only be not None for the root Node)
         self.height = -1  # <== ADDED BY ME; used for caching the result of .get_height()
+        self._attr_kind = _ATTR_KIND_UNKNOWN  # <== ADDED BY ME; used for caching in .get_node_attributes()
+        # ADDED BY ME; cf. get_index():
+        self._index: Optional[TreeIndex] = None  # (shall only be not None for the root Node)
+        self._index_root: Optional[Node] = None  # the root whose index this Node was last indexed by
+        self._index_generation = -1  # the TreeIndex.generation of the index this Node was last indexed by
+        self._pre_order_no = -1  # only valid while the index of self._index_root is
+        self._subtree_end = -1  # only valid while the index of self._index_root is
+        self._first_literal: Optional[Node] = None  # only valid while the index of self._index_root is
+        self._ancestor_kinds = 0  # only valid while the index of self._index_root is
+        self._child_names: Optional[Tuple[str, ...]] = None  # <== ADDED BY ME; cf. get_child_names()
+        self._sorted_child_names: Optional[Tuple[str, ...]] = None  # <== ADDED BY ME; cf. get_sorted_child_names()
+        self._non_wildcard_child_names: Optional[frozenset[str]] = None  # <== ADDED BY ME; cf. get_non_wildcard_child_names()
+        self._start_pos = -1  # <== ADDED BY ME; used for caching the result of ._get_start_pos()
+        self._end_pos = -1  # <== ADDED BY ME; used for caching the result of ._get_end_pos()
+        self._string_form_cache: Optional[Tuple[Tuple[int, int], str]] = None  # <== ADDED BY ME; cf. _cached_string_form()
+        # ADDED BY ME; (Node._structure_version, result) of the last member_expression_get_leftmost_identifier() call:
+        self._leftmost_identifier_cache: Optional[Tuple[int, Node]] = None
+
+    # ADDED BY ME: only the Nodes of patterns ever have any of these set, so they share a single slot (cf. _WILDCARD):
+    is_wildcard = _pattern_flag_property(_WILDCARD)
+    is_identifier_regex = _pattern_flag_property(_IDENTIFIER_REGEX)
+    is_string_literal_regex = _pattern_flag_property(_STRING_LITERAL_REGEX)
+    is_negated_string_literal_regex = _pattern_flag_property(_NEGATED_STRING_LITERAL_REGEX)
 
     # ADDED BY ME:
     @classmethod
@@ -273,11 +806,11 @@ class Node:
 
         return pdg
 
-    # ADDED BY ME:
-    def __eq__(self, other):
-        if other is None:
-            return False
-        return self.id == other.id
+    # ADDED BY ME: Node IDs are unique within a process, so two Nodes are equal iff they are the very same object.
+    #              Using object's (C-level) identity-based __eq__ and __hash__ makes the sets/dicts of Nodes, that are
+    #              used all over the data flow analysis, a lot cheaper than calling a Python-level __eq__/__hash__.
+    #              Note that an (un)pickled copy of a Node is therefore not == to the original, cf. same_id() for that.
+    __eq__ = object.__eq__
 
     # ADDED BY ME:
     def __lt__(self, other):  # Needed whenever Nodes are stored in a heapq, or when a list of Nodes is sorted!
@@ -286,22 +819,152 @@ class Node:
         return self.id < other.id
 
     # ADDED BY ME: # Otherwise, there's a "TypeError: unhashable type: 'Identifier'" in set_provenance_dd().....
-    def __hash__(self):
-        return hash(self.id)
+    __hash__ = object.__hash__  # (cf. __eq__)
 
     # ADDED BY ME:
     def is_parsing_error(self) -> bool:
         return self.name == "ParsingError"
 
+    # ADDED BY ME:
+    def __getstate__(self):
+        state = self._get_instance_attributes()
+        state['_index'] = None  # the index is cheap to rebuild, don't pickle it
+        if '_df_parents_cache' in state:  # (Identifier._data_flow_version is per process)
+            state['_df_parents_cache'] = None
+        state['_string_form_cache'] = None  # (just like Node._structure_version)
+        state['_leftmost_identifier_cache'] = None
+        return None, state  # (no __dict__, only __slots__)
+
+    # ADDED BY ME:
+    def _get_instance_attributes(self) -> Dict[str, Any]:
+        """
+        The equivalent of `vars(self)`, which doesn't work for Nodes as they have __slots__ instead of a __dict__.
+        Attributes that have never been set (like `fun_param_parents` for most Nodes) are omitted.
+        """
+        missing = object()
+        attributes = dict()
+        for slot in _get_slot_names(type(self)):
+            value = getattr(self, slot, missing)
+            if value is not missing:
+                attributes[slot] = value
+        return attributes
+
+    # ADDED BY ME:
+    def get_index(self) -> TreeIndex:
+        """
+        Returns the TreeIndex of the tree `self` is part of, building it first if necessary.
+
+        The index is stored on the root Node and dropped again by every structural change of the tree that goes
+        through child(), set_child(), set_parent() or adopt_child(), cf. _invalidate_index().
+        """
+        root = self.root()  # (O(1) if self is still part of the tree indexed, cf. _get_indexed_root())
+        if root._index is None:
+            root._index = TreeIndex(root)
+        return root._index
+
+    # ADDED BY ME:
+    def _get_indexed_root(self) -> Optional[Self]:
+        """
+        Returns the root of the tree `self` is part of if it's known without walking up the tree, i.e., if the tree
+        currently has an index that `self` is part of (cf. get_index()), None otherwise. Never builds an index.
+        """
+        index_root = self._index_root
+        if index_root is not None:
+            index = index_root._index
+            if index is not None and index.generation == self._index_generation:
+                return index_root
+        return None
+
+    # ADDED BY ME:
+    def _get_index_if_cheap(self) -> Optional[TreeIndex]:
+        """
+        Returns the index of the tree `self` is part of if it's still valid, or if `self` is the root of its tree (then
+        (re-)building the index costs about as much as a single walk of the subtree would anyway), None otherwise.
+        Subtree queries fall back to walking the subtree when this returns None, so that modifying a tree and then
+        querying one of its subtrees, over and over again, does not re-index the entire tree each time.
+        """
+        if self._get_indexed_root() is not None or self.parent is None:
+            return self.get_index()
+        return None
+
+    # ADDED BY ME:
+    def _invalidate_index(self):
+        """
+        To be called whenever the structure of the tree `self` is part of changes.
+        Note that if the tree currently has an index, `self` is necessarily indexed by it, i.e., `self._index_root`
+        is the root of the tree.
+        """
+        Node._structure_version += 1  # <== ADDED BY ME; cf. _cached_string_form()
+        self._index = None  # self might be a root that's about to become a subtree of another tree
+        index_root = self._index_root
+        if index_root is not None:
+            index_root._index = None
+
+    # ADDED BY ME:
+    def _children_changed(self):
+        """
+        To be called whenever `self.children` changes, cf. child(), set_child() and adopt_child().
+        Must be called *before* changing `self.children` as it also replaces the shared empty tuple leaves start out
+        with by a list of their own.
+        """
+        if self.children is _EMPTY_TUPLE:
+            self.children = []
+        Node._structure_version += 1  # <== ADDED BY ME; cf. _cached_string_form()
+        self._child_names = None
+        self._sorted_child_names = None
+        self._non_wildcard_child_names = None
+        self._invalidate_index()
+
+    # ADDED BY ME:
+    def get_child_names(self) -> Tuple[str, ...]:
+        """
+        Returns the names of the children of this Node, in order (cached until the children change).
+        """
+        if self._child_names is None:
+            self._child_names = tuple(c.name for c in self.children)
+        return self._child_names
+
+    # ADDED BY ME:
+    def get_child_name_counts(self) -> Counter[str]:
+        """
+        Returns the multiset of the names of the children of this Node (matches() uses get_sorted_child_names()).
+        """
+        return Counter(self.get_child_names())
+
+    # ADDED BY ME:
+    def get_sorted_child_names(self) -> Tuple[str, ...]:
+        """
+        Returns the names of the children of this Node, sorted (cached until the children change), i.e., the multiset
+        of child names in a form that compares in C (unlike a Counter, whose __eq__ is implemented in Python).
+        """
+        if self._sorted_child_names is None:
+            self._sorted_child_names = tuple(sorted(self.get_child_names()))
+        return self._sorted_child_names
+
+    # ADDED BY ME:
+    def get_non_wildcard_child_names(self) -> frozenset[str]:
+        """
+        Returns the set of the names of the children of this Node, except for "*" (cached until the children change).
+        Used by matches() when `self` is a pattern whose children may be surrounded by additional children.
+        """
+        if self._non_wildcard_child_names is None:
+            self._non_wildcard_child_names = frozenset(self.get_child_names()).difference(("*",))
+        return self._non_wildcard_child_names
+
     # ADDED BY ME:
     def root(self) -> Self:
         """
         Returns the root Node of this tree.
-        """
-        if self.parent is None:
-            return self
-        else:
-            return self.parent.root()
+        O(1) when the tree is indexed, cf. _get_indexed_root(), otherwise walks up the tree.
+        """
+        root = self._get_indexed_root()  # <== CHANGED BY ME (was: recursive walk only)
+        if root is None:
+            root = self
+            parent = root.parent  # <== CHANGED BY ME (was: loading root.parent twice per level)
+            while parent is not None:
+                root = parent
+                parent = parent.parent
+        return root
 
     # ADDED BY ME:
     def get(self, child_role: str) -> List[Self]: # todo: refactor code everywhere to use this method where applicable!
@@ -331,9 +994,12 @@ class Node:
         """
         Returns an iterator over all the nodes in this tree.
         """
-        yield self
-        for child in self.children:
-            yield from child.all_nodes_iter()
+        # CHANGED BY ME: iterative pre-order traversal instead of a chain of nested generators (one per level):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
 
     # ADDED BY ME:
     def lhs(self) -> Self:
@@ -364,6 +1030,8 @@ class Node:
         Prints differences it finds between `self` and `other` to console.
         Prints nothing when no differences are found!
         """
+        self_vars = self._get_instance_attributes()  # <== CHANGED BY ME (was: vars(self))
+        other_vars = other._get_instance_attributes()  # <== CHANGED BY ME (was: vars(other))
         if self.name != other.name:
             print(f"[Diff] self.name == '{self.name}' != '{other.name}' == other.name")
         elif len(self.children) != len(other.children):
@@ -373,20 +1041,20 @@ class Node:
         elif ({k: v for k,v in self.attributes.items() if k != 'filename'}
               != {k: v for k,v in other.attributes.items() if k != 'filename'}):
             print(f"[Diff] self.attributes == {self.attributes} != {other.attributes} == other.attributes")
-        elif len(vars(self)) != len(vars(other)):
-            print(f"[Diff] len(vars(self)) == {len(vars(self))} != {len(vars(other))} == len(vars(other))")
-            self_keys = set(vars(self).keys())
-            other_keys = set(vars(other).keys())
+        elif len(self_vars) != len(other_vars):
+            print(f"[Diff] len(vars(self)) == {len(self_vars)} != {len(other_vars)} == len(vars(other))")
+            self_keys = set(self_vars.keys())
+            other_keys = set(other_vars.keys())
             if self_keys.issubset(other_keys):
                 print(f"[Diff] other has keys that self doesn't have: {other_keys.difference(self_keys)}")
             elif other_keys.issubset(self_keys):
                 print(f"[Diff] self has keys that other doesn't have: {self_keys.difference(other_keys)}")
 
-        for key, value in vars(self).items():
-            if key not in vars(other):
+        for key, value in self_vars.items():
+            if key not in other_vars:
                 print(f"[Diff] self has key '{self}' but other doesn't")
             elif isinstance(value, list):
-                value_other = vars(other)[key]
+                value_other = other_vars[key]
                 if not isinstance(value_other, list):
                     print(f"[Diff] self has key '{self}', which is a list, but for other it's not a list: {value_other}")
                 elif len(value) != len(value_other):
@@ -398,7 +1066,7 @@ class Node:
     # ADDED BY ME:
     def equivalent(self, other: Self) -> bool:
         """
-        Unlike == / __eq__, which checks the equality of the node ID, i.e., whether we're talking about the exact same
+        Unlike == / __eq__, which checks the identity of the Node, i.e., whether we're talking about the exact same
         subtree, this function tests for structural equivalence, e.g. to detect when an Expression is compared to itself
         as in "if (x + y == x + y) { ... }".
 
@@ -415,13 +1083,23 @@ class Node:
 
         This method is equivalent to using the matches() method with all match_* arguments set to True
         and all allow_* arguments set to False!
+        (It does not call matches() however but compares both trees pairwise directly, as there is neither any
+        permutation of children nor any padding with wildcards to consider then.)
         """
-        return self.matches(other,
-                            match_identifier_names=True,
-                            match_literals=True,
-                            match_operators=True,
-                            allow_additional_children=False,
-                            allow_different_child_order=False)
+        pairs = [(self, other)]
+        while pairs:
+            node, pattern = pairs.pop()
+            if pattern._pattern_flags & _WILDCARD:  # (pattern.is_wildcard)
+                continue
+            if node.name != pattern.name:
+                return False
+            predicate = _EQUIVALENCE_PREDICATES.get(node.name)
+            if predicate is not None and not predicate(node, pattern):
+                return False
+            if len(node.children) != len(pattern.children) or node.get_child_names() != pattern.get_child_names():
+                return False
+            pairs.extend(zip(node.children, pattern.children))
+        return True
 
     # ADDED BY ME:
     def get_data_flow_parents(self, max_depth=1_000_000_000) -> Set[Self]:
@@ -435,20 +1113,39 @@ class Node:
         if self.name != "Identifier":
             raise TypeError("get_data_flow_parents() may only be called on Identifiers")
 
+        return set(self._get_data_flow_parents_frozen(max_depth))  # (a copy, the caller may modify it)
+
+    # ADDED BY ME:
+    def _get_data_flow_parents_frozen(self, max_depth=1_000_000_000) -> frozenset:
+        """
+        Cf. get_data_flow_parents(). The result is cached until any data flow edge is added or removed, cf.
+        Identifier._data_flow_version. It is not cached when the BFS itself triggered the (lazy) generation of data
+        flow edges though, as these might lead to Nodes that had been expanded already.
+        """
+        cached = self._get_cached_data_flow_parents(max_depth)
+        if cached is not None:
+            return cached
+
+        data_flow_version = Identifier._data_flow_version
         self_data_dep_parents = {self}
+        frontier = [self]  # <== CHANGED BY ME: BFS, only the Nodes found in the previous round are expanded
         current_depth = 0
-        last_len_self_data_dep_parents = 1
-        while current_depth < max_depth:
-            for parent1 in self_data_dep_parents.copy():
-                self_data_dep_parents.update(grandparent.extremity for grandparent in parent1.data_dep_parents())
-                # Note: update() appends multiple elements to a set
+        while current_depth < max_depth and frontier:  # (stop as soon as a fixed point has been reached)
+            frontier = _expand_data_flow_parents(frontier, self_data_dep_parents)
             current_depth += 1
-            if len(self_data_dep_parents) == last_len_self_data_dep_parents:
-                break  # stop as soon as a fixed point has been reached :)
-            else:
-                last_len_self_data_dep_parents = len(self_data_dep_parents)
 
-        return self_data_dep_parents
+        result = frozenset(self_data_dep_parents)
+        if data_flow_version == Identifier._data_flow_version:
+            self._df_parents_cache = (data_flow_version, max_depth, result)
+        return result
+
+    # ADDED BY ME:
+    def _get_cached_data_flow_parents(self, max_depth) -> Optional[frozenset]:
+        """ The cached result of get_data_flow_parents(max_depth) if it's still up-to-date, None otherwise. """
+        cache = self._df_parents_cache
+        if cache is not None and cache[0] == Identifier._data_flow_version and cache[1] == max_depth:
+            return cache[2]
+        return None
 
     # ADDED BY ME:
     def get_data_flow_parents_in_order_no_split(self, max_depth=1_000_000_000) -> List[Self]:
@@ -465,15 +1162,16 @@ class Node:
             raise TypeError("get_data_flow_parents_in_order_no_split() may only be called on Identifiers")
 
         self_data_dep_parents = [self]
+        seen = {self}  # <== ADDED BY ME: instead of turning the whole list into a set again in each round
 
         current_depth = 0
         while current_depth < max_depth:
-            if len(set(self_data_dep_parents)) < len(self_data_dep_parents):  # Duplicate node => loop
-                break  # stop as soon as a loop is detected
-
             data_flow_parents: List[Node] = [p.extremity for p in self_data_dep_parents[-1].data_dep_parents()]
             if len(data_flow_parents) == 1:
                 self_data_dep_parents.append(data_flow_parents[0])
+                if data_flow_parents[0] in seen:  # Duplicate node => loop
+                    break  # stop as soon as a loop is detected
+                seen.add(data_flow_parents[0])
             else:
                 break
             current_depth += 1
@@ -494,10 +1192,29 @@ class Node:
         if self.name != "Identifier" or other.name != "Identifier":
             raise TypeError("is_data_flow_equivalent_identifier(): both self and other need to be Identifiers!")
 
-        self_data_dep_parents = self.get_data_flow_parents(max_depth=max_depth)
-        other_data_dep_parents = other.get_data_flow_parents(max_depth=max_depth)
-
-        return len(set.intersection(self_data_dep_parents, other_data_dep_parents)) > 0
+        # <== CHANGED BY ME: instead of computing both get_data_flow_parents() in full and intersecting them
+        #                    afterwards, do a bidirectional BFS that always expands the smaller one of the two
+        #                    frontiers (each side up to `max_depth` rounds) and stop as soon as both sides meet:
+        if self is other:
+            return True
+        # ADDED BY ME: when both sets of data flow parents are cached (and still up-to-date) already, simply use them:
+        self_data_dep_parents = self._get_cached_data_flow_parents(max_depth)
+        if self_data_dep_parents is not None:
+            other_data_dep_parents = other._get_cached_data_flow_parents(max_depth)
+            if other_data_dep_parents is not None:
+                return not self_data_dep_parents.isdisjoint(other_data_dep_parents)
+        seen = [{self}, {other}]
+        frontiers = [[self], [other]]
+        depths = [0, 0]
+        while True:
+            expandable = [side for side in (0, 1) if frontiers[side] and depths[side] < max_depth]
+            if not expandable:
+                return False
+            side = min(expandable, key=lambda s: len(frontiers[s]))
+            frontiers[side] = _expand_data_flow_parents(frontiers[side], seen[side])
+            depths[side] += 1
+            if not seen[1 - side].isdisjoint(frontiers[side]):  # <== CHANGED BY ME (was: any(... in ... for ...))
+                return True
 
     # ADDED BY ME:
     def get_all_data_flow_edges(self) -> List[Tuple[Self, Self]]:
@@ -563,7 +1280,7 @@ class Node:
     @classmethod
     def identifier(cls, name: str) -> Self:
         n = Identifier("Identifier", parent=None)
-        n.attributes['name'] = name
+        n.attributes['name'] = sys.intern(name)  # <== CHANGED BY ME (interned, cf. _INTERNED_ATTRIBUTES)
         return n
 
     # ADDED BY ME:
@@ -639,13 +1356,17 @@ class Node:
         Appends the given Node as a child and then returns itself again.
         """
         # Safety check first:
-        if self.name in ["BinaryExpression", "LogicalExpression", "AssignmentExpression"] and len(self.children) >= 2:
-            raise TypeError(f"calling Node.child(): a(n) {self.name} cannot have more than 2 children; use nested Nodes instead!")
-        elif self.name in ["UnaryExpression", "UpdateExpression"] and len(self.children) >= 1:
-            raise TypeError(f"calling Node.child(): a(n) {self.name} cannot have more than 1 child!")
-        elif self.name in ["IfStatement"] and len(self.children) >= 3:
-            raise TypeError(f"calling Node.child(): a(n) {self.name} cannot have more than 3 children!")
+        max_children = _MAX_CHILDREN.get(self.name)
+        if max_children is not None and len(self.children) >= max_children:
+            if max_children == 1:
+                raise TypeError(f"calling Node.child(): a(n) {self.name} cannot have more than 1 child!")
+            elif max_children == 2:
+                raise TypeError(f"calling Node.child(): a(n) {self.name} cannot have more than 2 children; use nested Nodes instead!")
+            else:
+                raise TypeError(f"calling Node.child(): a(n) {self.name} cannot have more than {max_children} children!")
 
+        self._children_changed()
+        c._invalidate_index()
         self.children.append(c)
         c.parent = self
         return self
@@ -654,7 +1375,7 @@ class Node:
     def get_sibling(self, idx: int) -> Self:
         sibling = self.parent.children[idx]
         # Safety check, when the programmer calls get_sibling(), he likely wants a *different* Node:
-        assert sibling.id != self.id
+        assert sibling is not self
         return sibling
 
     # ADDED BY ME:
@@ -713,16 +1434,24 @@ class Node:
 
     # ADDED BY ME:
     def get_sibling_by_name(self, name: str) -> Optional[Self]:
-        for sibling in self.parent.children:
-            if sibling.name == name and sibling.id != self.id:
-                return sibling
-        return None
+        # CHANGED BY ME: searches the (cached) tuple of child names of the parent instead of looping over the siblings:
+        sibling_names = self.parent.get_child_names()
+        siblings = self.parent.children
+        i = -1
+        while True:
+            try:
+                i = sibling_names.index(name, i + 1)
+            except ValueError:
+                return None
+            if siblings[i] is not self:
+                return siblings[i]
 
     # ADDED BY ME:
     def get_only_sibling(self) -> Self:
-        siblings = [c for c in self.parent.children if c.id != self.id]
-        assert len(siblings) == 1
-        return siblings[0]
+        # CHANGED BY ME (was: building a list of all siblings first): exactly one sibling <=> exactly two children:
+        children = self.parent.children
+        assert len(children) == 2
+        return children[1] if children[0] is self else children[0]
 
     # ADDED BY ME:
     def has_sibling(self, name: str) -> bool:
@@ -741,7 +1470,17 @@ class Node:
         """
         Returns all siblings of this Node, i.e., all the children of this Node's parent, except itself.
         """
-        return [child for child in self.parent.children if child != self]
+        return [child for child in self.parent.children if child is not self]
+
+    # ADDED BY ME:
+    def iter_siblings(self) -> Iterator[Self]:
+        """
+        Like siblings() but yields the siblings one by one instead of building a list; use this when only
+        iterating over them once, e.g., with any() or all().
+        """
+        for child in self.parent.children:
+            if child is not self:
+                yield child
 
     # ADDED BY ME:
     def grandparent(self) -> Optional[Self]:
@@ -763,14 +1502,25 @@ class Node:
         Return the parent, grandparent, great-grandparent, etc. of this Node (in that order)
         until the root node is reached.
         """
-        if self.parent is None:
-            return []
-        else:
-            return [self.parent] + self.parent.get_parents()
+        parents = []
+        parent = self.parent
+        while parent is not None:
+            parents.append(parent)
+            parent = parent.parent
+        return parents
 
     # ADDED BY ME:
     def is_inside(self, other: Self) -> bool:
-        return other in self.get_parents()
+        # CHANGED BY ME (was: `other in self.get_parents()`): O(1) using the tree index if the tree currently has one
+        #                (cf. lies_within()), otherwise walk up the tree without building a list of all the parents:
+        if self._get_indexed_root() is not None:
+            return other is not None and self.lies_within(other)
+        parent = self.parent
+        while parent is not None:
+            if parent is other:
+                return True
+            parent = parent.parent
+        return False
 
     # ADDED BY ME:
     def is_inside_or_is(self, other: Self) -> bool:
@@ -788,6 +1538,9 @@ class Node:
         Raises an AssertionError when `stop_at_parent not in self.get_parents()` !!!
         """
         if stop_at_parent is None:
+            # ADDED BY ME: O(1) using the tree index, if the tree currently has one (walking up is cheap otherwise):
+            if self._get_indexed_root() is not None and all(name in _ANCESTOR_KIND_BITS for name in names):
+                return (self._ancestor_kinds & sum(_ANCESTOR_KIND_BITS[name] for name in set(names))) != 0
             return any(name in [parent.name for parent in self.get_parents()] for name in names)
         else:
             parents: List[Node] = self.get_parents()
@@ -893,6 +1646,10 @@ class Node:
 
     # ADDED BY ME:
     def has_ancestor(self, allowed_ancestor_names) -> bool:
+        # ADDED BY ME: O(1) using the tree index if the tree currently has one (cf. is_inside_a()):
+        if not isinstance(allowed_ancestor_names, str) and self._get_indexed_root() is not None\
+                and all(name in _ANCESTOR_KIND_BITS for name in allowed_ancestor_names):
+            return (self._ancestor_kinds & sum(_ANCESTOR_KIND_BITS[name] for name in set(allowed_ancestor_names))) != 0
         parent = self.parent
         while parent is not None:
             if parent.name in allowed_ancestor_names:
@@ -914,51 +1671,67 @@ class Node:
 
     # ADDED BY ME:
     def __str__(self) -> str:
-        str_repr = ""
-
-        attributes_of_interest = {
-            "Identifier": 'name',
-            "Literal": ['raw', 'value', 'regex'],  # note that 'regex' is an optional attribute of a Literal!
-            "TemplateElement": ['value'],
-            "BinaryExpression": 'operator',      # 'instanceof' | 'in' | '+' | '-' | '*' | '/' | '%' | '**' |
-                                                 # '|' | '^' | '&' | '==' | '!=' | '===' | '!==' |
-                                                 # '<' | '>' | '<=' | '<<' | '>>' | '>>>'
-            "LogicalExpression": 'operator',     # || or &&
-            "AssignmentExpression": 'operator',  # '=' | '*=' | '**=' | '/=' | '%=' | '+=' | '-=' |
-                                                 # '<<=' | '>>=' | '>>>=' | '&=' | '^=' | '|='
-            "UnaryExpression": 'operator',       # '+' | '-' | '~' | '!' | 'delete' | 'void' | 'typeof'
-            "UpdateExpression": 'operator',      # '++' or '--'
-            "MemberExpression": 'computed',      # (boolean)  # ToDo: handle True/False cases differently in code (x.y vs. x[y])
-            "FunctionExpression": ['generator', 'async', 'expression'],  # (all booleans)
-            "VariableDeclaration": 'kind',       # 'var' | 'const' | 'let'
-            "Property": ['computed', 'method', 'shorthand'],
-            "MethodDefinition": ['computed', 'kind', 'static'],
-        }
+        buffer = []
+        self._dump(buffer, 0)
+        return "".join(buffer)
 
-        if self.name in attributes_of_interest.keys():
-            if isinstance(attributes_of_interest[self.name], list):
-                str_repr = f"[{self.id}] [{self.name}::{str({attr: self.attributes[attr] for attr in attributes_of_interest[self.name] if attr in self.attributes})}] ({len(self.children)} child{'ren' if len(self.children) != 1 else ''})"
+    # ADDED BY ME:
+    def _dump(self, buffer: List[str], depth: int):
+        """
+        Appends the string representation of this subtree to `buffer`, each line indented by `depth` more tabs than
+        in str(self). Iterative, to not build (and re-split) the string representation of each subtree separately.
+        """
+        stack = [(self, depth)]
+        while stack:
+            node, node_depth = stack.pop()
+            header = node._str_header()
+            if node_depth == 0:  # (the lines of the header of the root aren't indented)
+                buffer.append(header)
+                buffer.append("\n")
             else:
-                str_repr = f"[{self.id}] [{self.name}:\"{self.attributes[attributes_of_interest[self.name]]}\"] ({len(self.children)} child{'ren' if len(self.children) != 1 else ''})"
+                indentation = "\t" * node_depth
+                if header.isprintable():  # <== ADDED BY ME: the usual case, a single line (cf. str.splitlines())
+                    buffer.append(indentation)
+                    buffer.append(header)
+                    buffer.append("\n")
+                else:
+                    for line in header.splitlines():
+                        buffer.append(indentation)
+                        buffer.append(line)
+                        buffer.append("\n")
+            stack.extend((child, node_depth + 1) for child in reversed(node.children))
+
+    # ADDED BY ME:
+    def _str_header(self) -> str:
+        """
+        The first line of str(self), i.e., the description of this very Node (without its children).
+        """
+        attributes_of_interest = _STR_ATTRIBUTES_OF_INTEREST.get(self.name)
+        no_children = len(self.children)
+        children = f"({no_children} child{'ren' if no_children != 1 else ''})"
+        if attributes_of_interest is None:
+            str_repr = f"[{self.id}] [{self.name}] {children}"
+        elif isinstance(attributes_of_interest, list):
+            str_repr = f"[{self.id}] [{self.name}::{str({attr: self.attributes[attr] for attr in attributes_of_interest if attr in self.attributes})}] {children}"
         else:
-            str_repr = f"[{self.id}] [{self.name}] ({len(self.children)} child{'ren' if len(self.children) != 1 else ''})"
+            str_repr = f"[{self.id}] [{self.name}:\"{self.attributes[attributes_of_interest]}\"] {children}"
 
         str_repr += f" <<< {self.body}"  # e.g., "body", "expression", "argument", "params", "left", "right", ...
 
+        # CHANGED BY ME: the edges are joined at once instead of growing str_repr by one edge at a time.
+        # (Note that str() isn't cached: its result depends on the dependencies and the attributes of the Nodes, which
+        #  are changed in place all over the code base.)
         # cf. display_extension.py:
-        if self.name in STATEMENTS:
-            for cf_dep in self.control_dep_children:
-                str_repr += f" --{cf_dep.label}--> [{cf_dep.extremity.id}]"
+        if self._is_statement and self.control_dep_children:
+            str_repr += "".join([f" --{cf_dep.label}--> [{cf_dep.extremity.id}]"
+                                 for cf_dep in self.control_dep_children])
 
         # cf. display_extension.py:
-        if self.name == "Identifier":
-            for data_dep in self._data_dep_children:  # Note: calling str() does not trigger *generation* of DF edges!
-                str_repr += f" --{data_dep.label}--> [{data_dep.extremity.id}]"
-
-        str_repr += "\n"
+        if self.name == "Identifier" and self._data_dep_children:
+            # Note: calling str() does not trigger *generation* of DF edges!
+            str_repr += "".join([f" --{data_dep.label}--> [{data_dep.extremity.id}]"
+                                 for data_dep in self._data_dep_children])
 
-        for child in self.children:
-            str_repr += "\n".join(["\t" + line for line in child.__str__().splitlines()]) + "\n"
         return str_repr
 
     # ADDED BY ME:
@@ -970,7 +1743,7 @@ class Node:
         """
         Does this subtree contain any Literal (Node)?
         """
-        return self.get_literal_raw() is not None
+        return self._get_first_literal() is not None
 
     # ADDED BY ME:
     def get_literal_raw(self) -> Optional[str]:
@@ -981,31 +1754,44 @@ class Node:
         Returns the raw version of the literal, as it occurs in code, which is always a string
         (i.e., no conversion to integer/float/bool).
         """
-        if self.name == "Literal":
-            return self.attributes['raw']
-        elif len(self.children) == 0:
-            return None
-        else:
-            for child in self.children:
-                child_literal = child.get_literal_raw()
-                if child_literal is not None:
-                    return child_literal  # return the first Literal found
-            return None  # no child contains any Literal
+        first_literal = self._get_first_literal()
+        if first_literal is not None:
+            return first_literal.attributes['raw']  # return the first Literal found (in pre-order)
+        return None  # no Node in this subtree is a Literal
+
+    # ADDED BY ME:
+    def _get_first_literal(self) -> Optional[Self]:
+        """
+        Returns the first Literal (in pre-order) of this subtree, or None if there is none.
+        O(1) if the tree currently has an index (cf. TreeIndex), otherwise a pre-order traversal that stops at the
+        first Literal (building the index of the whole tree would take longer than that).
+        """
+        if self._get_indexed_root() is not None:
+            return self._first_literal
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.name == "Literal":
+                return node
+            stack.extend(reversed(node.children))
+        return None
 
     # ADDED BY ME:
     def get_all(self, node_name: str) -> List[Self]:
         """
         Returns all nodes of a given type/name, e.g. all "VariableDeclaration" nodes.
+        The nodes are returned in pre-order, cf. get_all_as_iter().
+        Uses the index of the tree, cf. _get_index_if_cheap(), walks the subtree otherwise; the list returned is a fresh
+        copy either way.
         """
-        result = []
-        if self.name == node_name:
-            result.append(self)
-        for child in self.children:
-            result.extend(child.get_all(node_name))
-        return result
+        index = self._get_index_if_cheap()
+        if index is None:
+            return list(self.get_all_as_iter(node_name))
+        nodes, lo, hi = index.get_range(self, node_name)
+        return nodes[lo:hi]
 
     # ADDED BY ME:
-    def get_all_as_iter(self, node_name: Optional[str]):  # ToDo: optimize by creating a Dict[str, List[Node]] at AST generation?!
+    def get_all_as_iter(self, node_name: Optional[str]):
         """
         Returns all nodes of a given type/name, e.g. all "VariableDeclaration" nodes.
         Unlike get_all(), which returns a list, this function returns an iterator.
@@ -1036,10 +1822,24 @@ class Node:
             [9] [Identifier:"x"]
             [10] [Identifier:"y"]
         """
-        if node_name is None or self.name == node_name:
-            yield self
-        for child in self.children:
-            yield from child.get_all_as_iter(node_name)
+        if node_name is None:
+            yield from self.all_nodes_iter()
+            return
+        # CHANGED BY ME: when the tree is indexed anyway (cf. _get_indexed_root()), use the index's per-name bucket
+        #                instead of walking the entire subtree, as e.g. for every call of
+        #                `root.get_all_as_iter("FunctionDeclaration")`; never builds an index though:
+        if self._get_indexed_root() is not None:
+            nodes, lo, hi = self.get_index().get_range(self, node_name)
+            for i in range(lo, hi):
+                yield nodes[i]
+            return
+        # CHANGED BY ME: iterative pre-order traversal instead of a chain of nested generators (one per level):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.name == node_name:
+                yield node
+            stack.extend(reversed(node.children))
 
     # ADDED BY ME:
     def get_all_as_iter2(self, node_names: List[str]):
@@ -1053,10 +1853,13 @@ class Node:
                         supplying the empty list `[]` will result in an empty generator being returned;
                         supplying `None` will result in an error.
         """
-        if self.name in node_names:
-            yield self
-        for child in self.children:
-            yield from child.get_all_as_iter2(node_names)
+        # CHANGED BY ME: iterative pre-order traversal instead of a chain of nested generators (one per level):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.name in node_names:
+                yield node
+            stack.extend(reversed(node.children))
 
     # ADDED BY ME:
     def get_all_identifiers(self) -> List[Self]:
@@ -1064,9 +1867,17 @@ class Node:
 
     # ADDED BY ME:
     def get_all_identifiers_by_name(self, name: str) -> List[Self]:
-        return [identifier
-                for identifier in self.get_all("Identifier")
-                if identifier.attributes['name'] == name]
+        """
+        Returns all Identifiers named `name` inside `self`, in pre-order.
+        Uses the per-name Identifier buckets of the index of the tree, cf. TreeIndex.get_identifier_range(), if it's
+        cheap to get (cf. _get_index_if_cheap()), walks the subtree otherwise.
+        """
+        index = self._get_index_if_cheap()
+        if index is None:
+            return [identifier for identifier in self.get_all_as_iter("Identifier")
+                    if identifier.attributes.get('name') == name]
+        identifiers, lo, hi = index.get_identifier_range(self, name)
+        return identifiers[lo:hi]
 
     # ADDED BY ME:
     def get_all_identifiers_not_inside_a_as_iter(self,
@@ -1088,7 +1899,7 @@ class Node:
         elif include_self and self.name in forbidden_parent_names:
             pass  # do not yield anything
         else:
-            for identifier in self.get_all_as_iter("Identifier"):
+            for identifier in self.get_all_identifiers():  # <== CHANGED BY ME (was: get_all_as_iter("Identifier"))
                 if not identifier.is_inside_a(forbidden_parent_names, stop_at_parent=self):  # stop_at_parent=exclusive!
                     yield identifier
 
@@ -1098,7 +1909,7 @@ class Node:
         A function mostly for testing purposes, e.g., for use in unit tests.
         Raises a LookupError, unless the identifier with name `name` occurs exactly *once* inside this PDG!
         """
-        result = [identifier for identifier in self.get_all("Identifier") if identifier.attributes['name'] == name]
+        result = self.get_all_identifiers_by_name(name)  # <== CHANGED BY ME
         if len(result) == 1:
             return result[0]
         elif len(result) == 0:
@@ -1114,13 +1925,43 @@ class Node:
         occurs exactly *once* inside this PDG, this function always returns the 1st occurrence of an Identifier
         with the given name.
         """
-        result = [identifier for identifier in self.get_all("Identifier") if identifier.attributes['name'] == name]
-        return min(result, key=lambda node: node.code_occurrence())
+        result = self.get_all_identifiers_by_name(name)  # <== CHANGED BY ME
+        return min(result, key=Node._get_start_pos)  # <== CHANGED BY ME (was: key=lambda node: node.code_occurrence())
 
     # ADDED BY ME:
     def get_all_literals(self) -> List[Self]:
         return self.get_all("Literal")
 
+    # ADDED BY ME:
+    def iter_all_literals(self) -> Iterator[Self]:
+        """
+        Like get_all_literals() but yields the Literals one by one (in pre-order), for callers that stop at the first
+        Literal of interest: uses the index of the tree if the tree currently has one (without copying the Literals
+        out of it), otherwise walks the subtree lazily (without building the index, cf. _get_first_literal()).
+        """
+        if self._get_indexed_root() is not None:
+            nodes, lo, hi = self.get_index().get_range(self, "Literal")
+            for i in range(lo, hi):
+                yield nodes[i]
+        else:
+            yield from self.get_all_as_iter("Literal")
+
+    # ADDED BY ME:
+    def iter_all_string_literals(self) -> Iterator[Self]:
+        """
+        Like iter_all_literals() but only yields the string Literals, i.e., those whose raw value is enclosed in
+        double or single quotation marks; the index of the tree (if there currently is one) keeps these in a list of
+        their own, so all the other Literals don't even have to be looked at.
+        """
+        if self._get_indexed_root() is not None:
+            string_literals, lo, hi = self.get_index().get_string_literal_range(self)
+            for i in range(lo, hi):
+                yield string_literals[i]
+        else:
+            for literal in self.get_all_as_iter("Literal"):
+                if _is_string_literal_raw(literal.attributes.get('raw')):
+                    yield literal
+
     # ADDED BY ME:
     def get_all_if_statements_inside(self) -> List[Self]:
         """
@@ -1151,10 +1992,7 @@ class Node:
 
     # ADDED BY ME:
     def has_child(self, child_name: str) -> bool:
-        for child in self.children:
-            if child.name == child_name:
-                return True
-        return False
+        return child_name in self.get_child_names()  # <== CHANGED BY ME (the child names are cached)
 
     # ADDED BY ME:
     def has_descendent(self, child_names: List[str]) -> bool:
@@ -1165,9 +2003,9 @@ class Node:
 
     # ADDED BY ME:
     def get_child(self, child_name: str) -> Optional[Self]:
-        for child in self.children:
-            if child.name == child_name:
-                return child
+        child_names = self.get_child_names()  # <== CHANGED BY ME (the child names are cached)
+        if child_name in child_names:
+            return self.children[child_names.index(child_name)]
         return None
 
     # ADDED BY ME:
@@ -1177,8 +2015,7 @@ class Node:
 
     # ADDED BY ME:
     def is_nth_child_of_parent(self, n: int) -> bool:
-        sibling_ids = [sibling.id for sibling in self.parent.children]
-        return self.id == sibling_ids[n]
+        return self.parent.children[n] is self  # <== CHANGED BY ME (was: building a list of all sibling IDs first)
 
     # ADDED BY ME:
     def is_nth_child_of_a(self, n: int, allowed_parent_names: List[str]) -> bool:
@@ -1186,8 +2023,7 @@ class Node:
             return False
         if self.parent.name not in allowed_parent_names:
             return False
-        sibling_ids = [sibling.id for sibling in self.parent.children]
-        return self.id == sibling_ids[n]
+        return self.parent.children[n] is self  # <== CHANGED BY ME (was: building a list of all sibling IDs first)
 
     # ADDED BY ME:
     def is_within_the_nth_child_of_a(self, n: int, allowed_ancestor_names: List[str]) -> bool:
@@ -1207,8 +2043,8 @@ class Node:
 
     # ADDED BY ME:
     def is_nth_child_of_parent_ignoring_certain_siblings(self, n: int, siblings_names_to_ignore: List[str]) -> bool:
-        sibling_ids = [sibling.id for sibling in self.parent.children if sibling.name not in siblings_names_to_ignore]
-        return self.id == sibling_ids[n]
+        siblings = [sibling for sibling in self.parent.children if sibling.name not in siblings_names_to_ignore]
+        return siblings[n] is self
 
     # ADDED BY ME:
     def matches(self,
@@ -1226,63 +2062,138 @@ class Node:
         * "name" attributes of "Identifier" nodes (only if match_identifier_names == True)
         * "raw" attributes of "Literal" nodes (only if match_literals == True)
         """
-        if pattern.is_wildcard:
-            return True  # Note that the calls to all() below may also return True as all([]) is True!
+        if pattern._pattern_flags & _WILDCARD:  # (pattern.is_wildcard)
+            return True
         elif self.name != pattern.name:
             return False
-        elif match_identifier_names and self.name == "Identifier" and not pattern.is_identifier_regex and pattern.attributes['name'] != self.attributes['name']:
-            return False
-        elif match_identifier_names and self.name == "Identifier" and pattern.is_identifier_regex and not re.fullmatch(pattern.attributes['name'], self.attributes['name']):
-            return False
-        elif match_literals and self.name == "Literal" and not pattern.is_string_literal_regex and not pattern.is_negated_string_literal_regex and self.attributes['value'] != pattern.attributes['value']:
-            return False
-        elif match_literals and self.name == "Literal" and pattern.is_string_literal_regex and not re.fullmatch(pattern.attributes['value'], self.attributes['value']):
-            return False
-        elif match_literals and self.name == "Literal" and pattern.is_negated_string_literal_regex and re.fullmatch(pattern.attributes['value'], self.attributes['value']):
-            return False
-        elif match_operators and self.name in ["UpdateExpression", "UnaryExpression", "BinaryExpression",
-                                               "LogicalExpression", "AssignmentExpression"]\
-                and self.attributes['operator'] != pattern.attributes['operator']:
-            return False
-        elif not allow_additional_children and len(self.children) != len(pattern.children):
-            return False
-        elif allow_additional_children and len(self.children) < len(pattern.children):  # pattern cannot be matched
-            return False
-        elif not allow_additional_children and allow_different_child_order and sorted([c.name for c in self.children]) != sorted([c.name for c in pattern.children]):
+        elif not self._has_subtree_size(*pattern._get_subtree_size_constraint(allow_additional_children)):
+            return False  # (cheap early reject)
+        return self._matches(pattern,
+                             (bool(match_identifier_names), bool(match_literals), bool(match_operators),
+                              bool(allow_additional_children), bool(allow_different_child_order)),
+                             _new_match_memo(allow_additional_children, allow_different_child_order))
+
+    # ADDED BY ME:
+    def get_subtree_size(self) -> int:
+        """
+        Returns the number of Nodes in the subtree rooted at this Node (including this Node itself).
+        Uses the index of the tree, cf. _get_index_if_cheap(), walks the subtree otherwise.
+        """
+        if self._get_index_if_cheap() is None:
+            return sum(1 for _ in self.all_nodes_iter())
+        return self._subtree_end - self._pre_order_no
+
+    # ADDED BY ME:
+    def _get_subtree_size_constraint(self, allow_additional_children: bool) -> Tuple[int, int, bool]:
+        """
+        For `self` being used as a pattern in matches(), returns a tuple `(size, height, exact)`, meaning that any
+        subtree matching this pattern has to have (exactly, if `exact == True`) at least `size` Nodes and a height of
+        (exactly, if `exact == True`) at least `height`, cf. get_height().
+        """
+        index = self._get_index_if_cheap()
+        if index is None:
+            return 1, 1, False  # (no constraint; not worth walking the pattern's subtree for)
+        size = self._subtree_end - self._pre_order_no
+        height = self.height  # (up-to-date, as the index was just (re-)built if necessary, cf. TreeIndex)
+        wildcards, lo, hi = index.get_range(self, "*")
+        if hi == lo:
+            return size, height, not allow_additional_children
+        elif any(wildcards[i].children for i in range(lo, hi)):
+            return 1, 1, False  # (the children of wildcards are ignored by matches(), don't bother with this edge case)
+        else:
+            return size, height, False  # a wildcard matches a subtree of any size/height (i.e., of size/height >= 1)
+
+    # ADDED BY ME:
+    def _has_subtree_size(self, size: int, height: int, exact: bool) -> bool:
+        """
+        Cf. _get_subtree_size_constraint(). Only a cheap early reject: returns True when the tree has no valid index
+        (instead of walking the subtree, or re-indexing the entire tree, for each match candidate).
+        """
+        if self._get_indexed_root() is None:
+            return True
+        subtree_size = self._subtree_end - self._pre_order_no  # (self.height is up-to-date, too, cf. TreeIndex)
+        if exact:
+            return subtree_size == size and self.height == height
+        else:
+            return subtree_size >= size and self.height >= height
+
+    # ADDED BY ME:
+    def _matches(self, pattern: Self, flags: tuple, memo: Optional[Dict[Tuple[int, int], bool]]) -> bool:
+        """
+        Implementation of matches(), where `flags` is the tuple of its 5 boolean arguments (in the same order, as bools).
+
+        The result for each pair of (sub)tree and (sub)pattern is memoized in `memo`, so that the same pair is not
+        compared over and over again (e.g., once for every permutation of their siblings) within a single call to
+        matches() or find_pattern(). As its keys are `id()`s, `memo` must not outlive the Nodes it refers to.
+        `memo` is None when no pair can be compared twice anyway, cf. _new_match_memo().
+        """
+        if pattern._pattern_flags & _WILDCARD:  # (pattern.is_wildcard)
+            return True  # Note that the calls to all() below may also return True as all([]) is True!
+
+        name = self.name
+        if name != pattern.name:
             return False
-        elif not allow_additional_children and not allow_different_child_order and [c.name for c in self.children] != [c.name for c in pattern.children]:
+
+        if memo is None:
+            return self._matches_uncached(pattern, flags, memo)
+        key = (id(self), id(pattern))
+        result = memo.get(key)
+        if result is None:
+            result = memo[key] = self._matches_uncached(pattern, flags, memo)
+        return result
+
+    # ADDED BY ME:
+    def _matches_uncached(self, pattern: Self, flags: tuple, memo: Optional[Dict[Tuple[int, int], bool]]) -> bool:
+        """
+        Cf. _matches(); assumes that `pattern` is no wildcard and that the names of `self` and `pattern` are equal.
+        """
+        allow_additional_children = flags[3]
+        allow_different_child_order = flags[4]
+
+        predicate = _MATCH_PREDICATES_BY_FLAGS[flags].get(self.name)
+        if predicate is not None and not predicate(self, pattern):
             return False
-        elif allow_additional_children and not set(c.name for c in pattern.children if not c.is_wildcard).issubset(set(c.name for c in self.children)):
+
+        children = self.children
+        pattern_children = pattern.children
+        no_children = len(children)
+
+        if not self._has_child_names_matching(pattern, allow_additional_children, allow_different_child_order):
             return False
-        elif not allow_additional_children:
-            if allow_different_child_order:  # If allow_different_child_order=True (and allow_additional_children=False)...
-                permutations = itertools.permutations(pattern.children)  # ...allow all permutations of the children in the pattern (but not additional children).
-            else:  # If allow_different_child_order=False (and allow_additional_children=False)...
-                permutations = [pattern.children]  # ...allow only 1 permutation of children, namely the one in the pattern!
-
-            # Iterate through all possible child permutations and try to find a match:
-            return any(all(self.children[i].matches(permutation[i], match_identifier_names, match_literals, match_operators, allow_additional_children, allow_different_child_order)
-                           for i in range(len(self.children)))
-                           for permutation in permutations)
-        else:  # allow_additional_children == True:
-            assert len(self.children) >= len(pattern.children)  # (cf. elif check above)
 
-            # Fill pattern up with wildcards:
-            pattern_children_plus_wildcards = pattern.children + [Node.wildcard()] * (len(self.children) - len(pattern.children))
-            assert len(pattern_children_plus_wildcards) == len(self.children)
-            # IMPORTANT: Note that some wildcards might have already been present in the supplied pattern!!!
+        if not allow_additional_children:
+            if allow_different_child_order:
+                # Most AST Nodes have at most 3 children, handle those cases without any itertools overhead:
+                if no_children == 0:
+                    return True
+                elif no_children == 1:
+                    return children[0]._matches(pattern_children[0], flags, memo)
+                elif no_children == 2:
+                    c0, c1 = children
+                    p0, p1 = pattern_children
+                    return (c0._matches(p0, flags, memo) and c1._matches(p1, flags, memo))\
+                        or (c0._matches(p1, flags, memo) and c1._matches(p0, flags, memo))
+                elif no_children == 3:
+                    return any(children[0]._matches(pattern_children[i0], flags, memo)
+                               and children[1]._matches(pattern_children[i1], flags, memo)
+                               and children[2]._matches(pattern_children[i2], flags, memo)
+                               for i0, i1, i2 in _PERMUTATIONS_OF_3)
+                # Allow all permutations of the children in the pattern (but not additional children), i.e.,
+                #   look for a perfect matching between the children and the pattern children:
+                return _exists_child_assignment(children, pattern_children, flags, memo)
+            else:
+                # Allow only 1 permutation of children, namely the one in the pattern!
+                return all(children[i]._matches(pattern_children[i], flags, memo) for i in range(no_children))
 
-            permutations = itertools.permutations(pattern_children_plus_wildcards)
+        else:  # allow_additional_children == True:
+            if allow_different_child_order:
+                # Each pattern child has to be matched by a different child, all other children are unconstrained
+                #   (i.e., matched by the wildcards the pattern would be filled up with):
+                return _exists_child_assignment(children, pattern_children, flags, memo)
 
-            # Cf. above:
-            return any(all(self.children[i].matches(permutation[i], match_identifier_names, match_literals, match_operators, allow_additional_children, allow_different_child_order)
-                           for i in range(len(self.children)))
-                           for permutation in permutations
-                           if allow_different_child_order
-                              or    [el for el in permutation      if not el.is_wildcard]
-                                 == [el for el in pattern.children if not el.is_wildcard]
-                       )
-            # The last check skips permutations that changed the order of the non-wildcard nodes if allow_different_child_order=False.
+            # (Previously, the pattern was filled up with wildcards and all of its permutations that keep the order of
+            #  the non-wildcard nodes were tried; this is equivalent but doesn't take O(no_children!) time:)
+            return _exists_ordered_child_embedding(children, pattern_children, flags, memo)
 
         # Note:
         #
@@ -1301,6 +2212,25 @@ class Node:
         # => For any two Nodes w/o any children and the same name (as well as the same Identifier name for Identifiers/
         #    the same raw Literal value for Literals), matches() will return True!
 
+    # ADDED BY ME:
+    def _has_child_names_matching(self,
+                                  pattern: Self,
+                                  allow_additional_children: bool,
+                                  allow_different_child_order: bool) -> bool:
+        """
+        The checks of matches() on the names of the children of `self` and `pattern` only (necessary, not sufficient
+        for a match). Cheap, as the child names are cached, cf. get_child_names().
+        """
+        if not allow_additional_children:
+            if allow_different_child_order:
+                return self.get_sorted_child_names() == pattern.get_sorted_child_names()
+            else:
+                return self.get_child_names() == pattern.get_child_names()
+        else:
+            # Every non-wildcard pattern child needs a child with the same name:
+            return len(self.children) >= len(pattern.children)\
+                and pattern.get_non_wildcard_child_names().issubset(self.get_child_names())
+
     # ADDED BY ME:
     def find_pattern(self,
                      pattern: Self,
@@ -1315,14 +2245,25 @@ class Node:
         Cf. `Node.matches()` function.
         """
         result = []
-        all_match_candidates = self.get_all(pattern.name)
-        for match_candidate in all_match_candidates:
-            if match_candidate.matches(pattern,
-                                       match_identifier_names=match_identifier_names,
-                                       match_literals=match_literals,
-                                       match_operators=match_operators,
-                                       allow_additional_children=allow_additional_children,
-                                       allow_different_child_order=allow_different_child_order):
+        flags = (bool(match_identifier_names), bool(match_literals), bool(match_operators),
+                 bool(allow_additional_children), bool(allow_different_child_order))
+        # shared by all match candidates, as they may be nested inside one another:
+        memo = _new_match_memo(allow_additional_children, allow_different_child_order)
+        size_constraint = pattern._get_subtree_size_constraint(allow_additional_children)
+        # CHANGED BY ME (was: iterating over `self.get_all(pattern.name)`): go through the candidates right inside the
+        #                tree index, instead of copying them out of it first (if it's cheap to get, cf. _get_index_if_cheap()):
+        index = self._get_index_if_cheap()
+        if index is None:
+            candidates = list(self.get_all_as_iter(pattern.name))
+            lo, hi = 0, len(candidates)
+        else:
+            candidates, lo, hi = index.get_range(self, pattern.name)
+        for i in range(lo, hi):
+            match_candidate = candidates[i]
+            if match_candidate._has_subtree_size(*size_constraint)\
+                    and match_candidate._has_child_names_matching(pattern, allow_additional_children,
+                                                                  allow_different_child_order)\
+                    and match_candidate._matches(pattern, flags, memo):
                 if allow_unreachable or (not match_candidate.is_unreachable()):
                     if os.environ.get('PRINT_PDGS') == "yes":
                         print(f"Pattern Match:\n{match_candidate}")
@@ -1352,42 +2293,51 @@ class Node:
         """
         if self.name != "MemberExpression":
             raise TypeError("member_expression_to_string() may only be called on a MemberExpression")
+        return self._cached_string_form(Node._member_expression_to_string_uncached)  # <== ADDED BY ME
 
+    # ADDED BY ME:
+    def _member_expression_to_string_uncached(self) -> str:
+        """ Cf. member_expression_to_string(); assumes that `self` is a MemberExpression. """
         # Note: * for "a.b",  computed=False
         #       * for "x[y]", computed=True
 
+        # CHANGED BY ME: lhs()/rhs() (each checking the number of children) are called only once each now:
+        rhs_node = self.rhs()  # (first, as before, such that a MemberExpression w/o 2 children raises an RHSException)
+        lhs_node = self.lhs()
+
         if self.attributes['computed']:  # "x[y]"
             try:
-                literal_evaluated = self.rhs().static_eval(allow_partial_eval=False)
+                literal_evaluated = rhs_node.static_eval(allow_partial_eval=False)
                 if isinstance(literal_evaluated, str):
                     rhs = "." + literal_evaluated  # turns "a['b']" into "a.b"
                 else:
                     rhs = f"[{literal_evaluated}]"
             except StaticEvalException:
-                rhs = f"[<{self.rhs().name}>]"
+                rhs = f"[<{rhs_node.name}>]"
         else:  # "a.b"
-            if self.rhs().name == "Identifier":
-                rhs = "." + self.rhs().attributes['name']
+            if rhs_node.name == "Identifier":
+                rhs = "." + rhs_node.attributes['name']
             else:
-                rhs = f".<{self.rhs().name}>"
+                rhs = f".<{rhs_node.name}>"
 
-        if self.lhs().name == "ThisExpression":
+        lhs_name = lhs_node.name
+        if lhs_name == "ThisExpression":
             return "this" + rhs
 
-        elif self.lhs().name == "Identifier":
-            return self.lhs().attributes['name'] + rhs
+        elif lhs_name == "Identifier":
+            return lhs_node.attributes['name'] + rhs
 
-        elif self.lhs().name == "MemberExpression": # ToDo: handle a[b] and a['b'] type member expressions as well!!!
-            return self.lhs().member_expression_to_string() + rhs
+        elif lhs_name == "MemberExpression": # ToDo: handle a[b] and a['b'] type member expressions as well!!!
+            return lhs_node.member_expression_to_string() + rhs
 
-        elif self.lhs().name == "CallExpression" and self.lhs().children[0].name == "ThisExpression":
+        elif lhs_name == "CallExpression" and lhs_node.children[0].name == "ThisExpression":
             return "this()" + rhs
 
-        elif self.lhs().name == "CallExpression" and self.lhs().children[0].name == "Identifier":
-            return self.lhs().children[0].attributes['name'] + "()" + rhs
+        elif lhs_name == "CallExpression" and lhs_node.children[0].name == "Identifier":
+            return lhs_node.children[0].attributes['name'] + "()" + rhs
 
-        elif self.lhs().name == "CallExpression" and self.lhs().children[0].name == "MemberExpression":
-            return self.lhs().children[0].member_expression_to_string() + "()" + rhs
+        elif lhs_name == "CallExpression" and lhs_node.children[0].name == "MemberExpression":
+            return lhs_node.children[0].member_expression_to_string() + "()" + rhs
 
         else:  # e.g., a Literal, NewExpression, FunctionExpression, AssignmentExpression, ...
             # Examples:
@@ -1395,9 +2345,28 @@ class Node:
             #   - NewExpression:        new RegExp(/^(http|https):\/\//).test(u[0])  => "<NewExpression>.test"
             #   - FunctionExpression:   (function foo() { return 42; }).bar          => "<FunctionExpression>.bar"
             #   - AssignmentExpression: (x='foo').length                             => "<AssignmentExpression>.length"
-            return f"<{self.lhs().name}>" + rhs
+            return f"<{lhs_name}>" + rhs
             # Note how "<XYZ>" is *NOT* a valid JavaScript identifier! (see https://mothereff.in/js-variables)
 
+    # ADDED BY ME:
+    def _cached_string_form(self, compute: Callable[[Self], str]) -> str:
+        """
+        Returns `compute(self)`, cached in `self._string_form_cache`, for member_expression_to_string() and
+        call_expression_get_full_function_name(): both walk down a whole MemberExpression chain and are called over
+        and over again for the same Nodes.
+        Their results only depend on the tree and, via static_eval(), on the data flow, so the cached result is reused
+        as long as neither Node._structure_version nor Identifier._data_flow_version changed. (As static_eval() may
+        trigger the lazy generation of data flows itself, a result computed while they changed isn't cached.)
+        """
+        versions = (Node._structure_version, Identifier._data_flow_version)
+        cache = self._string_form_cache
+        if cache is not None and cache[0] == versions:
+            return cache[1]
+        result = compute(self)
+        if versions == (Node._structure_version, Identifier._data_flow_version):
+            self._string_form_cache = (versions, result)
+        return result
+
     # ADDED BY ME:
     def find_member_expressions_ending_in(self, suffix: str) -> List[Self]:
         result = []
@@ -1417,9 +2386,15 @@ class Node:
         elif len(self.children) == 0:
             raise TypeError("member_expression_get_leftmost_identifier() called on a MemberExpression w/o any children")
 
+        # ADDED BY ME: the result only depends on the structure of the tree, so it's cached until that changes:
+        structure_version = Node._structure_version
+        cache = self._leftmost_identifier_cache
+        if cache is not None and cache[0] == structure_version:
+            return cache[1]
+
         leftmost_identifier = self.children[0]
 
-        while leftmost_identifier.name in ["MemberExpression", "CallExpression"]:
+        while leftmost_identifier.name in ("MemberExpression", "CallExpression"):
             # interface MemberExpression {
             #     computed: boolean;
             #     object: Expression;
@@ -1431,6 +2406,7 @@ class Node:
             # }
             leftmost_identifier = leftmost_identifier.children[0]
 
+        self._leftmost_identifier_cache = (structure_version, leftmost_identifier)  # <== ADDED BY ME
         return leftmost_identifier
 
     # ADDED BY ME:
@@ -1462,7 +2438,11 @@ class Node:
         """
         if self.name != "CallExpression":
             raise TypeError("call_expression_get_full_function_name() may only be called on a CallExpression")
+        return self._cached_string_form(Node._call_expression_get_full_function_name_uncached)  # <== ADDED BY ME
 
+    # ADDED BY ME:
+    def _call_expression_get_full_function_name_uncached(self) -> str:
+        """ Cf. call_expression_get_full_function_name(); assumes that `self` is a CallExpression. """
         # Out of the Esprima docs:
         #
         # interface CallExpression {
@@ -1542,11 +2522,23 @@ class Node:
         it way accessed, e.g.: ("chrome.cookies", "chrome.cookies.getAll").
         """
         sensitive_apis_accessed = set()
-        for call_expression in self.get_all("CallExpression"):
-            full_function_name = call_expression.call_expression_get_full_function_name()
+        apis_by_length = _prefixes_by_length(tuple(apis))  # <== ADDED BY ME
+        # CHANGED BY ME (was: get_all()): go through the CallExpressions right inside the tree index, if it's cheap to get:
+        index = self._get_index_if_cheap()
+        if index is None:
+            call_expressions = list(self.get_all_as_iter("CallExpression"))
+            lo, hi = 0, len(call_expressions)
+        else:
+            call_expressions, lo, hi = index.get_range(self, "CallExpression")
+        for i in range(lo, hi):
+            full_function_name = call_expressions[i].call_expression_get_full_function_name()
             if "()" not in full_function_name:  # do not consider any complex function names like "x().y().z()"!
-                for api in apis:
-                    if full_function_name.startswith(api):  # such that "chrome.cookies" catches "chrome.cookies.getAll" calls for example!
+                # CHANGED BY ME (was: `for api in apis: if full_function_name.startswith(api): ...`):
+                for length, apis_of_length in apis_by_length:
+                    if length > len(full_function_name):
+                        break  # (the APIs are sorted by length)
+                    api = full_function_name[:length]
+                    if api in apis_of_length:  # such that "chrome.cookies" catches "chrome.cookies.getAll" calls for example!
                         sensitive_apis_accessed.add((api, full_function_name))
         return sensitive_apis_accessed
 
@@ -1560,12 +2552,10 @@ class Node:
 
         Returns `None` when this Node isn't part of any Statement.
         """
-        if self.name in STATEMENTS:
-            return self
-        elif self.parent is not None:
-            return self.parent.get_statement()
-        else:
-            return None
+        node = self
+        while node is not None and not node._is_statement:
+            node = node.parent
+        return node
 
     # ADDED BY ME:
     def get_next_higher_up_statement(self) -> Optional[Self]:
@@ -1593,12 +2583,10 @@ class Node:
         Note that else-if branches are modelled as nested IfStatements (IfStatements inside the else-branches of other
         IfStatements) and will therefore be considered as well!
         """
-        if self.name == "IfStatement":
-            return self
-        elif self.parent is not None:
-            return self.parent.get_innermost_surrounding_if_statement()
-        else:
-            return None
+        node = self
+        while node is not None and node.name != "IfStatement":
+            node = node.parent
+        return node
 
     # ADDED BY ME:
     def get_all_surrounding_if_statements(self) -> List[Self]:
@@ -1609,17 +2597,16 @@ class Node:
         Note that else-if branches are modelled as nested IfStatements (IfStatements inside the else-branches of other
         IfStatements) and will therefore be considered as well!
         """
+        # ADDED BY ME: O(1) in the common case of code not inside any if-statement, using the tree index (if any):
+        if self.name != "IfStatement" and self._get_indexed_root() is not None\
+                and not self._ancestor_kinds & _ANCESTOR_KIND_BITS["IfStatement"]:
+            return []
         result = []
         current = self
-
-        while True:
+        while current is not None:
             if current.name == "IfStatement":
                 result.append(current)
-            if current.parent is None:
-                break
-            else:
-                current = current.parent
-
+            current = current.parent
         return result
 
     # ADDED BY ME:
@@ -1655,24 +2642,19 @@ class Node:
         Returns True iff this node is either a ReturnStatement itself or is inside of one inside the AST, by
         traversing parent to parent until there is no parent anymore.
         """
-        if self.name == "ReturnStatement":
-            return True
-        elif self.parent is not None:
-            return self.parent.is_inside_return_statement()
-        else:
-            return False
+        # CHANGED BY ME: has_ancestor() answers from the ancestors' kinds cached in the tree index if the tree currently
+        #                has one, otherwise it walks up the tree (building the whole index just for this would be O(n)):
+        return self.name == "ReturnStatement" or self.has_ancestor(("ReturnStatement",))
 
     # ADDED BY ME:
     def get_surrounding_return_statement(self) -> Optional[Self]:
         """
         Returns `None` if and only if is_inside_return_statement() returns False.
         """
-        if self.name == "ReturnStatement":
-            return self
-        elif self.parent is not None:
-            return self.parent.get_surrounding_return_statement()
-        else:
-            return None
+        node = self
+        while node is not None and node.name != "ReturnStatement":
+            node = node.parent
+        return node
 
     # ##### On if statements: #####
     #
@@ -1763,30 +2745,38 @@ class Node:
             raise Exception(f"error in if_statement_has_else_if_branch(): if statement has unknown format:\n{self}")
 
     # ADDED BY ME:
-    def occurs_in_code_before(self, other_node: Self) -> bool:
-        assert self.get_file() == other_node.get_file()
+    def _get_start_pos(self) -> int:
+        """
+        Returns the start line and column of this Node packed into a single integer (line in the upper bits, column in
+        the lower 32 bits, as minified code may well have lines longer than 2**20 characters), so that comparing the
+        start positions of two Nodes is a single integer comparison. Cached until the 'loc' attribute is set again.
+        """
+        start_pos = self._start_pos
+        if start_pos < 0:
+            start = self.attributes['loc']['start']
+            start_pos = self._start_pos = (int(start['line']) << 32) | int(start['column'])
+        return start_pos
 
-        self_start_line = int(self.attributes['loc']['start']['line'])
-        self_start_column = int(self.attributes['loc']['start']['column'])
+    # ADDED BY ME:
+    def _get_end_pos(self) -> int:
+        """ Like _get_start_pos() but for the end line and column of this Node. """
+        end_pos = self._end_pos
+        if end_pos < 0:
+            end = self.attributes['loc']['end']
+            end_pos = self._end_pos = (int(end['line']) << 32) | int(end['column'])
+        return end_pos
 
-        other_start_line = int(other_node.attributes['loc']['start']['line'])
-        other_start_column = int(other_node.attributes['loc']['start']['column'])
+    # ADDED BY ME:
+    def occurs_in_code_before(self, other_node: Self) -> bool:
+        assert self.root() is other_node.root() or self.get_file() == other_node.get_file()  # <== CHANGED BY ME
 
-        return self_start_line < other_start_line or\
-                (self_start_line == other_start_line and self_start_column < other_start_column)
+        return self._get_start_pos() < other_node._get_start_pos()  # <== CHANGED BY ME (compares line & column)
 
     # ADDED BY ME:
     def occurs_in_code_after(self, other_node: Self) -> bool:
-        assert self.get_file() == other_node.get_file()
-
-        self_start_line = int(self.attributes['loc']['start']['line'])
-        self_start_column = int(self.attributes['loc']['start']['column'])
-
-        other_start_line = int(other_node.attributes['loc']['start']['line'])
-        other_start_column = int(other_node.attributes['loc']['start']['column'])
+        assert self.root() is other_node.root() or self.get_file() == other_node.get_file()  # <== CHANGED BY ME
 
-        return self_start_line > other_start_line or \
-            (self_start_line == other_start_line and self_start_column > other_start_column)
+        return self._get_start_pos() > other_node._get_start_pos()  # <== CHANGED BY ME (compares line & column)
 
     # ADDED BY ME:
     def get_loop_ancestors(self) -> List[Self]:
@@ -1824,7 +2814,8 @@ class Node:
         Parameters:
             other: the other Node for which to check whether `self` and `other` are in the same loop
         """
-        return len(set.intersection(set(self.get_loop_ancestors()), set(other.get_loop_ancestors()))) > 0
+        # CHANGED BY ME (was: `len(set.intersection(...)) > 0`), isdisjoint() stops at the first common loop:
+        return not set(self.get_loop_ancestors()).isdisjoint(other.get_loop_ancestors())
 
     # ADDED BY ME:
     def might_occur_after(self, other_node: Self) -> bool:
@@ -1885,23 +2876,8 @@ class Node:
         Returns a `CodeOccurrence` object that can be compared to other `CodeOccurrence` objects returned by this
         function using <, <=, >, >=, ==, != operators.
         """
-        @total_ordering
-        class CodeOccurrence:
-            def __init__(self, line, column):
-                self.line = line
-                self.column = column
-
-            def __eq__(self, other):
-                if other is None:
-                    return False
-                return self.line == other.line and self.column == other.column
-
-            def __lt__(self, other):  # implements the "<" operator; cf. logic in occurs_in_code_before()
-                return self.line < other.line or (self.line == other.line and self.column < other.column)
-
-        self_start_line = int(self.attributes['loc']['start']['line'])
-        self_start_column = int(self.attributes['loc']['start']['column'])
-        return CodeOccurrence(line=self_start_line, column=self_start_column)
+        # CHANGED BY ME: CodeOccurrence used to be (re-)defined on each call, it's a module-level class now:
+        return CodeOccurrence(self._get_start_pos())
 
     # ADDED BY ME:
     def lies_within(self, other_node: Self) -> bool:
@@ -1909,26 +2885,37 @@ class Node:
         Whether this node is a child, grand-child, great-grandchild, etc. of `other_node`.
         Returns False when self == other_node!
         """
-        parent = self.parent
-        while parent is not None:
-            if parent.id == other_node.id:
-                return True
-            parent = parent.parent
-        return False
+        # CHANGED BY ME: instead of walking up the tree, use the pre-order intervals of the tree index, cf. get_index():
+        #                the descendants of `other_node` are exactly the Nodes indexed in between its own position and
+        #                the end of its subtree; if `other_node` isn't part of the same (indexed) tree, it's no ancestor.
+        index_root = self._get_indexed_root()
+        if index_root is None:  # (the tree has no valid index (anymore), walk up the tree instead of rebuilding it)
+            parent = self.parent
+            while parent is not None:
+                if parent is other_node:
+                    return True
+                parent = parent.parent
+            return False
+        return other_node._index_root is index_root and other_node._index_generation == self._index_generation\
+            and other_node._pre_order_no < self._pre_order_no < other_node._subtree_end
 
     # ADDED BY ME:
     def lies_within_piece_of_code(self, other_start_line: int, other_start_col: int,
                                   other_end_line: int, other_end_col: int) -> bool:
-        self_start_line, self_start_col, self_end_line, self_end_col = self.get_location_as_tuple()
+        # CHANGED BY ME (was: comparing the lines and columns of self.get_location_as_tuple() one by one): compares the
+        #                packed (line, column) positions of _get_start_pos() and _get_end_pos() instead.
+        try:
+            self_start_pos = self._get_start_pos()
+            self_end_pos = self._get_end_pos()
+        except KeyError:  # (no location, cf. get_location_as_tuple())
+            return False
 
         # Example: If other_start_line == other_end_line == self_start_line == self_end_line:
         # other_start_col ************************************************************ other_end_col
         #                            self_start_col ----------- self_end_col
 
-        other_starts_before_self: bool = (other_start_line < self_start_line)\
-                                         or (other_start_line == self_start_line and other_start_col <= self_start_col)
-        self_ends_before_other: bool = (self_end_line < other_end_line)\
-                                         or (self_end_line == other_end_line and self_end_col <= other_end_col)
+        other_starts_before_self: bool = ((other_start_line << 32) | other_start_col) <= self_start_pos
+        self_ends_before_other: bool = self_end_pos <= ((other_end_line << 32) | other_end_col)
 
         return other_starts_before_self and self_ends_before_other
 
@@ -1958,15 +2945,15 @@ class Node:
             raise TypeError("Node.string_literal_without_quotation_marks() called on a non-string literal!")
 
     # ADDED BY ME:
-    def string_literal_matches_full_regex(self, regex: str) -> bool:
-        return re.fullmatch(regex, self.string_literal_without_quotation_marks()) is not None
+    def string_literal_matches_full_regex(self, regex: str | re.Pattern) -> bool:
+        return _compiled_regex(regex).fullmatch(self.string_literal_without_quotation_marks()) is not None
 
     # ADDED BY ME:
-    def string_literal_contains_regex(self, regex: str) -> bool:
-        return re.search(regex, self.string_literal_without_quotation_marks()) is not None
+    def string_literal_contains_regex(self, regex: str | re.Pattern) -> bool:
+        return _compiled_regex(regex).search(self.string_literal_without_quotation_marks()) is not None
 
     # ADDED BY ME:
-    def any_literal_inside_matches_full_regex(self, regex: str) -> bool:
+    def any_literal_inside_matches_full_regex(self, regex: str | re.Pattern) -> bool:
         """
         Does any literal inside this subtree match the given regular expression?
         The entire raw literal has to match the given regular expression!
@@ -1975,25 +2962,27 @@ class Node:
         If you want to match entire string literals but don't care about the type of quotation marks used,
         consider using any_string_literal_inside_matches_full_regex() instead.
         """
-        for literal in self.get_all_literals():
-            if re.fullmatch(regex, literal.attributes['raw']):
+        pattern = _compiled_regex(regex)  # <== CHANGED BY ME (was: looked up once per literal)
+        for literal in self.iter_all_literals():  # <== CHANGED BY ME (was: get_all_literals())
+            if pattern.fullmatch(literal.attributes['raw']):
                 return True
         return False
 
     # ADDED BY ME:
-    def any_literal_inside_contains_regex(self, regex: str) -> bool:
+    def any_literal_inside_contains_regex(self, regex: str | re.Pattern) -> bool:
         """
         Does any literal inside this subtree match the given regular expression?
         Beware that literals may be string, integer or float literals!
         Unlike any_literal_inside_matches_full_regex(), the match found does *not* have to be the *full* literal!
         """
-        for literal in self.get_all_literals():
-            if re.search(regex, literal.attributes['raw']):
+        pattern = _compiled_regex(regex)  # <== CHANGED BY ME (was: looked up once per literal)
+        for literal in self.iter_all_literals():  # <== CHANGED BY ME (was: get_all_literals())
+            if pattern.search(literal.attributes['raw']):
                 return True
         return False
 
     # ADDED BY ME:
-    def any_string_literal_inside_matches_full_regex(self, regex: str) -> bool:
+    def any_string_literal_inside_matches_full_regex(self, regex: str | re.Pattern) -> bool:
         """
         Tries to find a string literal matching the given regular expression, ignoring the leading and trailing
         quotation mark. Integer and float literals are ignored.
@@ -2006,16 +2995,16 @@ class Node:
         # const string1 = "A string primitive";
         # const string2 = 'Also a string primitive';
         # const string3 = `Yet another string primitive`; // <----- We do not consider template strings!
-        for literal in self.get_all_literals():
-            raw = literal.attributes['raw']
-            if raw[0] == raw[-1] and raw[0] in ["\"", "'"]:  # literal is a (correct) string literal
-                string_inside_quotes = raw[1:-1]  # remove the quotation marks
-                if re.fullmatch(regex, string_inside_quotes):
-                    return True
+        pattern = _compiled_regex(regex)  # <== CHANGED BY ME (was: looked up once per literal)
+        # CHANGED BY ME (was: going through get_all_literals(), skipping those that aren't (correct) string literals):
+        for literal in self.iter_all_string_literals():
+            string_inside_quotes = literal.attributes['raw'][1:-1]  # remove the quotation marks
+            if pattern.fullmatch(string_inside_quotes):
+                return True
         return False
 
     # ADDED BY ME:
-    def any_string_literal_inside_contains_regex(self, regex: str) -> bool:
+    def any_string_literal_inside_contains_regex(self, regex: str | re.Pattern) -> bool:
         """
         Tries to find a string literal matching the given regular expression, ignoring the leading and trailing
         quotation mark. Integer and float literals are ignored.
@@ -2029,27 +3018,67 @@ class Node:
         # const string2 = 'Also a string primitive';
         # const string3 = `Yet another string primitive`;
         #     => not considered by us here; Espree generates a TemplateLiteral Node and not a Literal Node for those!
-        for literal in self.get_all_literals():
-            raw = literal.attributes['raw']
-            if raw[0] == raw[-1] and raw[0] in ["\"", "'"]:  # literal is a (correct) string literal
-                string_inside_quotes = raw[1:-1]  # remove the quotation marks
-                if re.search(regex, string_inside_quotes):
-                    return True
+        pattern = _compiled_regex(regex)  # <== CHANGED BY ME (was: looked up once per literal)
+        # CHANGED BY ME (was: going through get_all_literals(), skipping those that aren't (correct) string literals):
+        for literal in self.iter_all_string_literals():
+            string_inside_quotes = literal.attributes['raw'][1:-1]  # remove the quotation marks
+            if pattern.search(string_inside_quotes):
+                return True
         return False
 
+    # ADDED BY ME:
+    def any_literals_inside_match_regexes(self,
+                                          regexes: List[str | re.Pattern],
+                                          full: bool,
+                                          string_literals_only: bool) -> Dict[str | re.Pattern, bool]:
+        """
+        Checks multiple regexes against the literals inside this subtree at once, in a single pass over them, instead
+        of one pass per regex. Returns, for each of the given `regexes`, whether any literal matches it.
+
+        With `full=True`, the entire(!) literal has to match (cf. re.fullmatch()), otherwise a match anywhere inside
+        of it suffices (cf. re.search()).
+        With `string_literals_only=True`, only string literals are considered, ignoring their leading and trailing
+        quotation mark (cf. any_string_literal_inside_matches_full_regex()), otherwise the raw literals of all types
+        are matched (cf. any_literal_inside_matches_full_regex()).
+        Stops early once every regex has been matched.
+        """
+        patterns = [_compiled_regex(regex) for regex in regexes]
+        matched = [False] * len(patterns)
+        no_unmatched = len(patterns)
+        for literal in self.iter_all_string_literals() if string_literals_only else self.iter_all_literals():
+            if no_unmatched == 0:
+                break
+            raw = literal.attributes['raw']
+            if string_literals_only:
+                raw = raw[1:-1]  # remove the quotation marks
+            for i, pattern in enumerate(patterns):
+                if not matched[i] and (pattern.fullmatch(raw) if full else pattern.search(raw)):
+                    matched[i] = True
+                    no_unmatched -= 1
+        return dict(zip(regexes, matched))
+
     # ADDED BY ME:
     def get_height(self) -> int:
         """
         Height will be 1 for leaf nodes.
         """
         if len(self.children) == 0:
-            return 1  # end of recursion
-        else:
-            # Compute the height using recursion and cache the result, unless it has already been cached:
-            if self.height == -1:
-                self.height = 1 + max(child.get_height() for child in self.children)
-                # => Note how all the child height will become cached as well!
-            return self.height
+            return 1
+        elif self.height == -1:
+            # CHANGED BY ME (was: `1 + max(child.get_height() for child in self.children)`, i.e., one recursive call
+            #                per Node): compute the heights in post-order using an explicit stack instead, caching the
+            #                height of each (inner) Node on the way, just like the recursive version did:
+            stack = [(self, False)]
+            while stack:
+                node, children_done = stack.pop()
+                if children_done:
+                    node.height = 1 + max(child.height if child.children else 1 for child in node.children)
+                else:
+                    stack.append((node, True))
+                    for child in node.children:
+                        if child.children and child.height == -1:
+                            stack.append((child, False))
+        return self.height
 
     # ADDED BY ME:
     def promise_returning_function_call_get_all_then_calls(self, resolve_function_references=True) -> List[Self]:
@@ -2177,13 +3206,27 @@ class Node:
         Returns the length of the shortest data flow path when there are multiple paths from `self` to `other`.
         """
         assert self.name == "Identifier" and other.name == "Identifier"
-        if self == other:
+        if self is other:
             return 0
-        elif len(self.data_dep_children()) == 0:
-            return float("inf")
-        else:
-            return 1 + min(data_flow_child.extremity.data_flow_distance_to(other)
-                           for data_flow_child in self.data_dep_children())
+        # CHANGED BY ME (was: `1 + min(child.data_flow_distance_to(other) for child in ...)`, i.e., a recursive search
+        #                exploring the same Identifiers over and over again, and never terminating on data flow cycles):
+        #                a breadth-first search, `other` is first found at its shortest distance:
+        seen = {self}
+        frontier = [self]
+        distance = 0
+        while frontier:
+            distance += 1
+            new_frontier = []
+            for identifier in frontier:
+                for data_flow_child in identifier.data_dep_children():
+                    child = data_flow_child.extremity
+                    if child is other:
+                        return distance
+                    if child not in seen:
+                        seen.add(child)
+                        new_frontier.append(child)
+            frontier = new_frontier
+        return float("inf")
 
     # ADDED BY ME:
     def function_Identifier_get_FunctionDeclaration(self,
@@ -2284,9 +3327,16 @@ class Node:
 
         assert self.name == "Identifier"
 
-        function_declarations_in_scope = [fd for fd in self.root().get_all_as_iter("FunctionDeclaration")
-                                          if fd.function_declaration_get_name() == self.attributes['name']
-                                          and self.is_inside(fd.function_declaration_get_scope())]
+        # CHANGED BY ME (was: going through all the FunctionDeclarations of the whole tree, checking the name and
+        #                whether `self` is inside the scope of each of them): the FunctionDeclarations with the right name
+        #                are looked up by scope in the tree index, for each ancestor of `self`, innermost scope first:
+        function_declarations_by_scope = self.get_index().get_function_declarations_by_scope(self.attributes['name'])
+        function_declarations_in_scope = []
+        if function_declarations_by_scope:
+            ancestor = self.parent
+            while ancestor is not None:
+                function_declarations_in_scope.extend(function_declarations_by_scope.get(ancestor, []))
+                ancestor = ancestor.parent
 
         if len(function_declarations_in_scope) == 0:
             if print_warning_if_not_found and os.environ.get('WARN_FUNC_DEF_NOT_FOUND') == "yes":
@@ -2323,15 +3373,9 @@ class Node:
             #     console.log(foo());         // <----- call/reference to a function named "foo"
             # }
             #
-            # Resolve this issue by returning the innermost matching FunctionDeclaration in scope:
-            innermost_func_decl = function_declarations_in_scope[0]
-            innermost_func_decl_scope = innermost_func_decl.function_declaration_get_scope()
-            for func_decl in function_declarations_in_scope[1:]:
-                func_decl_scope = func_decl.function_declaration_get_scope()
-                if func_decl_scope.is_inside(innermost_func_decl_scope):
-                    innermost_func_decl = func_decl
-                    innermost_func_decl_scope = func_decl_scope
-            return innermost_func_decl
+            # Resolve this issue by returning the innermost matching FunctionDeclaration in scope (if there are
+            #   multiple ones in the innermost scope, the first one, in pre-order):
+            return function_declarations_in_scope[0]  # <== CHANGED BY ME (the ones in the innermost scope come first)
 
     # ADDED BY ME:
     def declaration_get_scope(self) -> Self:
@@ -2380,8 +3424,18 @@ class Node:
         If the scope is indeed the entire program, the PDGs "Program" root node will be returned by this function!
         """
         assert self.name == "FunctionDeclaration"
+        # ADDED BY ME: the scopes of all FunctionDeclarations are remembered by the tree index (if there currently is
+        #              one), as they're asked for over and over again, cf. function_Identifier_get_FunctionDeclaration():
+        index_root = self._get_indexed_root()
+        if index_root is not None:
+            return index_root._index.get_function_declaration_scope(self)
+        return self._function_declaration_get_scope_uncached()
+
+    # ADDED BY ME:
+    def _function_declaration_get_scope_uncached(self) -> Self:
+        """ Cf. function_declaration_get_scope(). """
         p = self.parent
-        while p.name not in ["FunctionDeclaration", "FunctionExpression", "ArrowFunctionExpression", "Program"]:
+        while p.name not in _FUNCTION_SCOPE_NAMES:
             p = p.parent
         return p
         # Don't forget that functions might be declared inside ArrowFunctionExpressions as well, the scope is going
@@ -4741,7 +5795,14 @@ class Node:
         return not self.children
 
     def set_attribute(self, attribute_type: str, node_attribute: Any):
+        if attribute_type in _INTERNED_ATTRIBUTES and type(node_attribute) is str:  # <== ADDED BY ME
+            node_attribute = sys.intern(node_attribute)
         self.attributes[attribute_type] = node_attribute
+        self._attr_kind = _ATTR_KIND_UNKNOWN  # <== ADDED BY ME
+        self._start_pos = -1  # <== ADDED BY ME
+        self._end_pos = -1  # <== ADDED BY ME
+        if attribute_type == 'name':  # <== ADDED BY ME; the index buckets Identifiers by name
+            self._invalidate_index()
 
     def set_body(self, body):
         self.body = body
@@ -4750,19 +5811,33 @@ class Node:
         self.body_list = bool_body_list
 
     def set_parent(self, parent: Self):
+        self._invalidate_index()  # <== ADDED BY ME
+        if parent is not None:
+            parent._invalidate_index()  # <== ADDED BY ME
         self.parent = parent
 
     def set_child(self, child: Self):
+        self._children_changed()  # <== ADDED BY ME
+        child._invalidate_index()  # <== ADDED BY ME
         self.children.append(child)
 
     def adopt_child(self, step_daddy):  # child = self changes parent
         old_parent = self.parent
+        old_parent._children_changed()  # <== ADDED BY ME
+        step_daddy._children_changed()  # <== ADDED BY ME
         old_parent.children.remove(self)  # Old parent does not point to the child anymore
         step_daddy.children.insert(0, self)  # New parent points to the child
-        self.set_parent(step_daddy)  # The child points to its new parent
+        # CHANGED BY ME (was: `self.set_parent(step_daddy)`): both trees involved were invalidated above already, and
+        #                dropping the index of a tree invalidates everything cached for each of its Nodes at once (cf.
+        #                _get_indexed_root()), so there's no need to invalidate again or to walk the adopted subtree:
+        self.parent = step_daddy  # The child points to its new parent
 
     def set_statement_dependency(self, extremity):
+        if self.statement_dep_children is _EMPTY_TUPLE:
+            self.statement_dep_children = []
         self.statement_dep_children.append(Dependence('statement dependency', extremity, ''))
+        if extremity.statement_dep_parents is _EMPTY_TUPLE:
+            extremity.statement_dep_parents = []
         extremity.statement_dep_parents.append(Dependence('statement dependency', self, ''))
 
     # def set_comment_dependency(self, extremity):
@@ -4770,25 +5845,44 @@ class Node:
         # extremity.statement_dep_parents.append(Dependence('comment dependency', self, 'c'))
 
     def is_comment(self) -> bool:
-        if self.name in COMMENTS:
+        if self.name in COMMENTS_SET:
             return True
         return False
 
     def get_node_attributes(self):
         """ Get the attributes regex, value or name of a node. """
+        attr_kind = self._attr_kind
+        if attr_kind == _ATTR_KIND_UNKNOWN:  # ADDED BY ME: which attribute to return is determined only once
+            attr_kind = self._attr_kind = self._get_attr_kind()
+        if attr_kind == _ATTR_KIND_NAME:
+            return True, self.attributes['name']
+        elif attr_kind == _ATTR_KIND_VALUE:
+            return True, self.attributes['value']
+        elif attr_kind == _ATTR_KIND_VALUE_RAW:
+            return True, self.attributes['value']['raw']
+        elif attr_kind == _ATTR_KIND_REGEX:
+            return True, '/' + str(self.attributes['regex']['pattern']) + '/'
+        return False, None  # Just None was a pb when used in get_node_value as value could be None
+
+    # ADDED BY ME:
+    def _get_attr_kind(self) -> int:
+        """
+        Which of its attributes get_node_attributes() returns for this Node; cached in self._attr_kind until the
+        next call to set_attribute().
+        """
         node_attribute = self.attributes
         if 'regex' in node_attribute:
             regex = node_attribute['regex']
             if isinstance(regex, dict) and 'pattern' in regex:
-                return True, '/' + str(regex['pattern']) + '/'
+                return _ATTR_KIND_REGEX
         if 'value' in node_attribute:
             value = node_attribute['value']
             if isinstance(value, dict) and 'raw' in value:
-                return True, value['raw']
-            return True, node_attribute['value']
+                return _ATTR_KIND_VALUE_RAW
+            return _ATTR_KIND_VALUE
         if 'name' in node_attribute:
-            return True, node_attribute['name']
-        return False, None  # Just None was a pb when used in get_node_value as value could be None
+            return _ATTR_KIND_NAME
+        return _ATTR_KIND_NONE
 
     def get_line(self) -> Optional[str]:
         """ Gets the line number where a given node is defined. """
@@ -4811,11 +5905,9 @@ class Node:
     def get_whole_line_of_code_as_string(self) -> str:
         try:
             line_no = self.attributes['loc']['start']['line'] - 1  # counting from 1 vs. counting from 0 (here)
-            filename = self.get_file()
-            with open(filename, 'r') as f:
-                for i, line in enumerate(f):
-                    if i == line_no:
-                        return line.rstrip()
+            lines = _get_file_lines(self.get_file())  # <== CHANGED BY ME (was: re-reading the file every time)
+            if 0 <= line_no < len(lines):
+                return lines[line_no].rstrip()
         except Exception as e:
             return f"<error: {e}>"
 
@@ -5016,16 +6108,10 @@ class Node:
             return -1
 
     def get_file(self) -> str:
-        parent = self
-        while True:
-            if parent is not None and parent.parent:
-                parent = parent.parent
-            else:
-                break
-        if parent is not None:
-            if "filename" in parent.attributes:
-                return parent.attributes["filename"]
-        return ''
+        # NOTE BY ME: always the filename of the root, not self.filename (which ast_to_ast_nodes() sets once and which
+        #             isn't updated when a Node is moved into another tree); the root is known in O(1) when the tree is
+        #             indexed (cf. _get_indexed_root()):
+        return self.root().attributes.get("filename", '')
 
     # ADDED BY ME:
     def rendezvous_is_correctly_uxss_sanitized(self) -> bool:
@@ -5112,20 +6198,21 @@ class Node:
         return False
 
 
+# ADDED BY ME: cf. literal_type():
+_LITERAL_TYPES = {str: 'String', bool: 'Bool', int: 'Int', float: 'Numeric', type(None): 'Null'}
+
+
 def literal_type(literal_node):
     """ Gets the type of a Literal node. """
 
     if 'value' in literal_node.attributes:
         literal = literal_node.attributes['value']
-        if isinstance(literal, str):
-            return 'String'
-        if isinstance(literal, int):
-            return 'Int'
-        if isinstance(literal, float):
-            return 'Numeric'
-        if isinstance(literal, bool):
-            return 'Bool'
-        if literal == 'null' or literal is None:
+        # CHANGED BY ME: one dict lookup instead of a chain of isinstance() checks; this also fixes True/False being
+        #                classified as 'Int' (bool being a subclass of int, the 'Bool' case was unreachable before):
+        lit_type = _LITERAL_TYPES.get(type(literal))
+        if lit_type is not None:
+            return lit_type
+        if literal == 'null':
             return 'Null'
     if 'regex' in literal_node.attributes:
         return 'RegExp'
@@ -5136,21 +6223,7 @@ def literal_type(literal_node):
 def shorten_value_list(value_list, value_list_shortened, counter=0):
     """ When a value is a list, shorten it so that keep at most LIMIT_SIZE characters. """
 
-    for el in value_list:
-        if isinstance(el, list):
-            value_list_shortened.append([])
-            counter = shorten_value_list(el, value_list_shortened[-1], counter)
-            if counter >= LIMIT_SIZE:
-                return counter
-        elif isinstance(el, str):
-            counter += len(el)
-            if counter < LIMIT_SIZE:
-                value_list_shortened.append(el)
-        else:
-            counter += len(str(el))
-            if counter < LIMIT_SIZE:
-                value_list_shortened.append(el)
-    return counter
+    return _shorten_value(value_list, value_list_shortened, counter, visited=set())  # <== CHANGED BY ME
 
 
 def shorten_value_dict(value_dict, value_dict_shortened, counter=0, visited=None):
@@ -5162,46 +6235,190 @@ def shorten_value_dict(value_dict, value_dict_shortened, counter=0, visited=None
         return counter
     visited.add(id(value_dict))
 
-    for k, v in value_dict.items():
-        if isinstance(k, str):
-            counter += len(k)
-        if isinstance(v, list):
-            value_dict_shortened[k] = []
-            counter = shorten_value_list(v, value_dict_shortened[k], counter)
-            if counter >= LIMIT_SIZE:
-                return counter
-        elif isinstance(v, dict):
-            value_dict_shortened[k] = {}
-            if id(v) in visited:
-                return counter
-            counter = shorten_value_dict(v, value_dict_shortened[k], counter, visited)
+    return _shorten_value(value_dict, value_dict_shortened, counter, visited)  # <== CHANGED BY ME
+
+
+# ADDED BY ME: the only leaf types _is_certainly_short() accepts, as `str(x) == repr(x)` for all but str, for which
+#              `len(x) < len(repr(x))`:
+_PLAIN_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+# ADDED BY ME:
+def _is_certainly_short(value) -> bool:
+    """
+    Returns True if the given list/dict value is known to be left unchanged by shorten_value_list() /
+    shorten_value_dict(), i.e., if the shorteners' count is known to stay below LIMIT_SIZE.
+
+    This is only decided for values consisting of nothing but lists, dicts and tuples (none of them contained twice,
+    in particular no cycles) with str/int/float/bool/None leaves (exact types, no subclasses): for those, repr(value)
+    contains the repr() of each element the shorteners count, which is at least as long as what they count for it
+    (len(k) for str keys, len(v) for str values, len(str(v)) == len(repr(v)) for all other elements, including nested
+    dicts/tuples inside lists), so `len(repr(value)) < LIMIT_SIZE` implies that their count is below LIMIT_SIZE, too.
+    For all other values (and values with LIMIT_SIZE elements or more), this returns False and the shorteners decide.
+    The check itself doesn't copy anything and the single repr() runs in C.
+    """
+    seen = set()
+    stack = [value]
+    remaining = LIMIT_SIZE  # (each element takes at least 1 character of repr(value))
+    while stack:
+        element = stack.pop()
+        element_type = type(element)
+        if element_type in _PLAIN_LEAF_TYPES:
+            pass
+        elif element_type is list or element_type is tuple or element_type is dict:
+            if id(element) in seen:
+                return False
+            seen.add(id(element))
+            if element_type is dict:
+                stack.extend(element.keys())
+                stack.extend(element.values())
+            else:
+                stack.extend(element)
+        else:
+            return False
+        remaining -= 1
+        if remaining <= 0:
+            return False
+    try:
+        return len(repr(value)) < LIMIT_SIZE
+    except RecursionError:  # (deeply nested)
+        return False
+
+
+# ADDED BY ME:
+def _shorten_value(value, value_shortened, counter, visited):
+    """
+    Iterative implementation of shorten_value_list() and shorten_value_dict() (which used to recurse into each other),
+    producing the exact same shortened values: nested lists/dicts are traversed depth-first, in order, and the
+    traversal stops as soon as a nested list/dict has been traversed and LIMIT_SIZE has been reached.
+    Once LIMIT_SIZE has been reached, the remaining non-list/dict elements aren't measured anymore, as nothing is
+    added for them anyway (the returned counter is therefore only exact as long as it's below LIMIT_SIZE).
+    A list that (directly or indirectly) contains itself is treated like a non-list element instead of causing a
+    RecursionError.
+    """
+    done = object()
+    is_dict = isinstance(value, dict)
+    stack = [(iter(value.items()) if is_dict else iter(value), value_shortened, is_dict, id(value))]
+    lists_on_stack = set() if is_dict else {id(value)}
+
+    while stack:
+        items, shortened, is_dict, value_id = stack[-1]
+        item = next(items, done)
+        if item is done:  # this list/dict has been traversed completely
+            stack.pop()
+            lists_on_stack.discard(value_id)
             if counter >= LIMIT_SIZE:
-                return counter
-        elif isinstance(v, str):
-            counter += len(v)
-            if counter < LIMIT_SIZE:
-                value_dict_shortened[k] = v
+                break
+            continue
+
+        if is_dict:
+            k, v = item
+            if isinstance(k, str) and counter < LIMIT_SIZE:
+                counter += len(k)
         else:
-            counter += len(str(v))
+            k, v = None, item
+
+        if isinstance(v, list) and id(v) not in lists_on_stack:
+            v_shortened = []
+            if is_dict:
+                shortened[k] = v_shortened
+            else:
+                shortened.append(v_shortened)
+            stack.append((iter(v), v_shortened, False, id(v)))
+            lists_on_stack.add(id(v))
+        elif is_dict and isinstance(v, dict):
+            shortened[k] = {}
+            if id(v) in visited:  # (stops the traversal of the current dict, just like it always did)
+                stack.pop()
+                if counter >= LIMIT_SIZE:
+                    break
+                continue
+            visited.add(id(v))
+            stack.append((iter(v.items()), shortened[k], True, id(v)))
+        elif counter < LIMIT_SIZE:
+            counter += len(v) if isinstance(v, str) else len(str(v))
             if counter < LIMIT_SIZE:
-                value_dict_shortened[k] = v
+                if is_dict:
+                    shortened[k] = v
+                else:
+                    shortened.append(v)
     return counter
 
 
+# ADDED BY ME: a forked child process (cf. multiprocessing) shall not continue with the Node IDs of its parent process:
+os.register_at_fork(after_in_child=_reset_id_counter)
+
+
+# ADDED BY ME: the attributes set by Value.__init__() / Function.__init__(), to be declared in the __slots__ of each
+#              Node subclass that is also a Value / Function (cf. Node.__slots__):
+_VALUE_SLOTS = ("value", "update_value", "provenance_children", "provenance_parents",
+                "provenance_parents_set", "seen_provenance")
+_FUNCTION_SLOTS = ("fun_name", "fun_params", "fun_return", "retraverse", "called")
+
+# ADDED BY ME: the bits of Identifier._df_computed:
+_DF_COMPUTED_BASIC = 1 << 0
+_DF_COMPUTED_CALL_EXPR_PARENTS = 1 << 1
+_DF_COMPUTED_CALL_EXPR_CHILDREN = 1 << 2
+_DF_COMPUTED_FUNC_RETURN_PARENTS = 1 << 3
+_DF_COMPUTED_FUNC_RETURN_CHILDREN = 1 << 4
+
+
+# ADDED BY ME:
+def _get_file_lines(filename: str) -> List[str]:
+    """
+    Returns the lines of the given file, cf. Node.get_whole_line_of_code_as_string().
+    The lines of the files read most recently are cached; a file that changed (or was replaced by another file of the
+    same name, e.g., a temporary file) since it was cached is read anew.
+    """
+    stat = os.stat(filename)
+    return _read_file_lines(filename, stat.st_mtime_ns, stat.st_size)
+
+
+# ADDED BY ME:
+@lru_cache(maxsize=32)
+def _read_file_lines(filename: str, _mtime_ns: int, _size: int) -> List[str]:
+    """ Cf. _get_file_lines(); the modification time and size of the file are only part of the cache key. """
+    with open(filename, 'r') as f:
+        return f.readlines()
+
+
+# ADDED BY ME:
+def _intern_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """ Interns the string values of the _INTERNED_ATTRIBUTES in `attributes` (in-place) and returns `attributes`. """
+    for key in _INTERNED_ATTRIBUTES:
+        value = attributes.get(key)
+        if type(value) is str:
+            attributes[key] = sys.intern(value)
+    return attributes
+
+
+# ADDED BY ME:
+@cache
+def _get_slot_names(cls) -> Tuple[str, ...]:
+    """ The names of the __slots__ of `cls` and of all of its base classes (except for __weakref__). """
+    return tuple(slot for klass in cls.__mro__ for slot in klass.__dict__.get('__slots__', ()) if slot != '__weakref__')
+
+
 class Value:
     """ To store the value of a specific node. """
 
+    __slots__ = ()  # <== ADDED BY ME; cf. _VALUE_SLOTS
+
     def __init__(self):
         self.value = None
         self.update_value = True
-        self.provenance_children = []
-        self.provenance_parents = []
-        self.provenance_children_set = set()
-        self.provenance_parents_set = set()
-        self.seen_provenance = set()
+        # CHANGED BY ME: all of these are copy-on-write, cf. _add_provenance_child() / _add_provenance_parent():
+        self.provenance_children = _EMPTY_TUPLE  # (becomes a dict, used as an insertion-ordered set, on first use)
+        self.provenance_parents = _EMPTY_TUPLE
+        self.provenance_parents_set = _EMPTY_TUPLE
+        # NOTE BY ME: Nodes hash and compare by identity (cf. Node.__eq__), so the sets above are effectively id()-keyed
+        #             already; keying them by id() explicitly would break as soon as a PDG is (un)pickled though:
+        self.seen_provenance = _EMPTY_TUPLE
 
     def set_value(self, value):
-        if isinstance(value, list):  # To shorten value if over LIMIT_SIZE characters
+        if isinstance(value, (list, dict)) and _is_certainly_short(value):  # <== ADDED BY ME
+            pass  # (nothing to shorten, cf. _is_certainly_short())
+        elif isinstance(value, list):  # To shorten value if over LIMIT_SIZE characters
             value_shortened = []
             counter = shorten_value_list(value, value_shortened)
             if counter >= LIMIT_SIZE:
@@ -5220,88 +6437,129 @@ class Value:
     def set_update_value(self, update_value):
         self.update_value = update_value
 
+    # ADDED BY ME:
+    def _add_provenance_child(self, child):
+        # Provenance children are never duplicated, therefore a single dict serves both as the (ordered) list and as
+        #   the set of them (the provenance parents on the other hand may be duplicated, cf. set_provenance()):
+        if self.provenance_children is _EMPTY_TUPLE:
+            self.provenance_children = {child: None}
+        else:
+            self.provenance_children.setdefault(child, None)
+
+    # ADDED BY ME:
+    def _add_provenance_parent(self, parent, allow_duplicate=False):
+        if self.provenance_parents is _EMPTY_TUPLE:
+            self.provenance_parents = []
+            self.provenance_parents_set = set()
+        if allow_duplicate or parent not in self.provenance_parents_set:
+            self.provenance_parents_set.add(parent)
+            self.provenance_parents.append(parent)
+
     def set_provenance_dd(self, extremity):  # Set Node provenance, set_data_dependency case
         # self is the origin of the DD while extremity is the destination of the DD
         if extremity.provenance_children:
             for child in extremity.provenance_children:
-                if child not in self.provenance_children_set:
-                    self.provenance_children_set.add(child)
-                    self.provenance_children.append(child)
+                self._add_provenance_child(child)
         else:
-            if extremity not in self.provenance_children_set:  # NOTE BY ME: TypeError: unhashable type: 'Identifier'
-                self.provenance_children_set.add(extremity)
-                self.provenance_children.append(extremity)
+            self._add_provenance_child(extremity)  # (Nodes are hashable by identity, cf. Node.__hash__)
         if self.provenance_parents:
             for parent in self.provenance_parents:
-                if parent not in extremity.provenance_parents_set:
-                    extremity.provenance_parents_set.add(parent)
-                    extremity.provenance_parents.append(parent)
+                extremity._add_provenance_parent(parent)
         else:
-            if self not in extremity.provenance_parents_set:
-                extremity.provenance_parents_set.add(self)
-                extremity.provenance_parents.append(self)
+            extremity._add_provenance_parent(self)
 
     def set_provenance(self, extremity):  # Set Node provenance, computed value case
         """
         a.b = c
         """
         if extremity in self.seen_provenance:
-            pass
+            return  # <== CHANGED BY ME (was: `pass`, i.e., seen_provenance never prevented anything from being redone)
+        if self.seen_provenance is _EMPTY_TUPLE:
+            self.seen_provenance = set()
         self.seen_provenance.add(extremity)
         # extremity was leveraged to compute the value of self
         if not isinstance(extremity, Node):  # extremity is None:
-            if self not in self.provenance_parents_set:
-                self.provenance_parents_set.add(self)
-                self.provenance_parents.append(self)
+            self._add_provenance_parent(self)
         elif isinstance(extremity, Value):
             if extremity.provenance_parents:
                 for parent in extremity.provenance_parents:
-                    if parent not in self.provenance_parents_set:
-                        self.provenance_parents_set.add(parent)
-                        self.provenance_parents.append(parent)
+                    self._add_provenance_parent(parent)
             else:
-                if extremity not in self.provenance_parents_set:
-                    self.provenance_parents_set.add(extremity)
-                    self.provenance_parents.append(extremity)
+                self._add_provenance_parent(extremity)
             if self.provenance_children:
                 for child in self.provenance_children:
-                    if child not in extremity.provenance_children_set:
-                        extremity.provenance_children_set.add(child)
-                        extremity.provenance_children.append(child)
+                    extremity._add_provenance_child(child)
             else:
-                if self not in extremity.provenance_children_set:
-                    extremity.provenance_children_set.add(self)
-                    extremity.provenance_children.append(self)
+                extremity._add_provenance_child(self)
         elif isinstance(extremity, Node):  # Otherwise very restrictive
-            self.provenance_parents_set.add(extremity)
-            self.provenance_parents.append(extremity)
+            self._add_provenance_parent(extremity, allow_duplicate=True)
             for extremity_child in extremity.children:  # Not necessarily useful
                 self.set_provenance(extremity_child)
 
     def set_provenance_rec(self, extremity):
-        self.set_provenance(extremity)
-        for child in extremity.children:
-            self.set_provenance_rec(child)
+        # CHANGED BY ME: iterative pre-order traversal (same order as the recursion before), without a call (and stack
+        #                frame) per Node of the subtree; leaves (the majority of the Nodes) never touch the stack:
+        set_provenance = self.set_provenance
+        stack = [extremity]
+        while stack:
+            node = stack.pop()
+            set_provenance(node)
+            children = node.children
+            if children:
+                stack.extend(reversed(children))
 
 
 class Identifier(Node, Value):
     """ Identifier Nodes. DD is on Identifier nodes. """
 
+    __slots__ = _VALUE_SLOTS + (  # <== ADDED BY ME
+        "code", "fun", "_data_dep_parents", "_data_dep_children", "_data_dep_children_ids",
+        "_df_computed", "_df_parents_cache",
+    )
+
+    # ADDED BY ME: incremented whenever a data flow edge is added to or removed from any PDG (of this process), so that
+    #              a cached result of get_data_flow_parents() is known to be still up-to-date iff it's unchanged:
+    _data_flow_version = 0
+
     def __init__(self, name, parent):
         Node.__init__(self, name, parent)
         Value.__init__(self)
         self.code = None
         self.fun = None
-        self._data_dep_parents = []  # <== RENAMED BY ME
-        self._data_dep_children = []  # <== RENAMED BY ME
+        self._data_dep_parents = _EMPTY_TUPLE  # <== RENAMED BY ME (& copy-on-write)
+        self._data_dep_children = _EMPTY_TUPLE  # <== RENAMED BY ME (& copy-on-write)
+        self._data_dep_children_ids: Set[int] | Tuple = _EMPTY_TUPLE  # <== ADDED BY ME; ids of the extremities in _data_dep_children
+
+        # ADDED BY ME: which of the lazily computed data flows have been computed already, one bit each (cf. the
+        #              _DF_COMPUTED_* constants), instead of one (8 byte) slot per boolean flag in each Identifier:
+        self._df_computed = 0
 
-        self.basic_data_dep_computed = False  # <== ADDED BY ME
+        # ADDED BY ME: (Identifier._data_flow_version, max_depth, result) of the last get_data_flow_parents() call:
+        self._df_parents_cache: Optional[Tuple[int, int, frozenset]] = None
 
-        self.call_expr_data_parents_computed = False  # <== ADDED BY ME
-        self.call_expr_data_children_computed = False  # <== ADDED BY ME
+    # ADDED BY ME:
+    @property
+    def basic_data_dep_computed(self) -> bool:
+        return bool(self._df_computed & _DF_COMPUTED_BASIC)
 
-        self.func_return_data_parents_computed = False  # <== ADDED BY ME
-        self.func_return_data_children_computed = False  # <== ADDED BY ME
+    # ADDED BY ME:
+    @basic_data_dep_computed.setter
+    def basic_data_dep_computed(self, computed: bool):
+        if computed:
+            self._df_computed |= _DF_COMPUTED_BASIC
+        else:
+            self._df_computed &= ~_DF_COMPUTED_BASIC
+
+    # ADDED BY ME:
+    def _df_not_yet_computed(self, flag: int) -> bool:
+        """
+        Returns True (and marks the data flows `flag` stands for as computed) iff they have not been computed yet.
+        """
+        df_computed = self._df_computed
+        if df_computed & flag:
+            return False
+        self._df_computed = df_computed | flag
+        return True
 
     # ADDED BY ME:
     def data_dep_parents(self,
@@ -5309,8 +6567,7 @@ class Identifier(Node, Value):
                          lazy_gen_call_expr_df: bool = True,
                          lazy_gen_func_return_df: bool = True) -> list:
         # Lazy computation of basic data dep parents & children:
-        if lazy_gen_basic_df and not self.basic_data_dep_computed:
-            self.basic_data_dep_computed = True
+        if lazy_gen_basic_df and self._df_not_yet_computed(_DF_COMPUTED_BASIC):
             from .add_missing_data_flow_edges import add_basic_data_flow_edges
             add_basic_data_flow_edges(
                 pdg=self.root(),
@@ -5320,8 +6577,7 @@ class Identifier(Node, Value):
             )
 
         # Lazy computation of call expression data dep parents:
-        if lazy_gen_call_expr_df and not self.call_expr_data_parents_computed:
-            self.call_expr_data_parents_computed = True
+        if lazy_gen_call_expr_df and self._df_not_yet_computed(_DF_COMPUTED_CALL_EXPR_PARENTS):
             from .add_missing_data_flow_edges import add_missing_data_flow_edges_call_expressions
             add_missing_data_flow_edges_call_expressions(
                 pdg=self.root(),
@@ -5330,8 +6586,7 @@ class Identifier(Node, Value):
             )
 
         # Lazy computation of function return data dep parents:
-        if lazy_gen_func_return_df and not self.func_return_data_parents_computed:
-            self.func_return_data_parents_computed = True
+        if lazy_gen_func_return_df and self._df_not_yet_computed(_DF_COMPUTED_FUNC_RETURN_PARENTS):
             from .add_missing_data_flow_edges import add_missing_data_flow_edges_function_returns
             add_missing_data_flow_edges_function_returns(
                 pdg=self.root(),
@@ -5347,8 +6602,7 @@ class Identifier(Node, Value):
                           lazy_gen_call_expr_df: bool = True,
                           lazy_gen_func_return_df: bool = True) -> list:
         # Lazy computation of basic data dep parents & children:
-        if lazy_gen_basic_df and not self.basic_data_dep_computed:
-            self.basic_data_dep_computed = True
+        if lazy_gen_basic_df and self._df_not_yet_computed(_DF_COMPUTED_BASIC):
             from .add_missing_data_flow_edges import add_basic_data_flow_edges
             add_basic_data_flow_edges(
                 pdg=self.root(),
@@ -5358,8 +6612,7 @@ class Identifier(Node, Value):
             )
 
         # Lazy computation of call expression data dep children:
-        if lazy_gen_call_expr_df and not self.call_expr_data_children_computed:
-            self.call_expr_data_children_computed = True
+        if lazy_gen_call_expr_df and self._df_not_yet_computed(_DF_COMPUTED_CALL_EXPR_CHILDREN):
             from .add_missing_data_flow_edges import add_missing_data_flow_edges_call_expressions
             add_missing_data_flow_edges_call_expressions(
                 pdg=self.root(),
@@ -5368,8 +6621,7 @@ class Identifier(Node, Value):
             )
 
         # Lazy computation of function return data dep children:
-        if lazy_gen_func_return_df and not self.func_return_data_children_computed:
-            self.func_return_data_children_computed = True
+        if lazy_gen_func_return_df and self._df_not_yet_computed(_DF_COMPUTED_FUNC_RETURN_CHILDREN):
             from .add_missing_data_flow_edges import add_missing_data_flow_edges_function_returns
             add_missing_data_flow_edges_function_returns(
                 pdg=self.root(),
@@ -5392,12 +6644,19 @@ class Identifier(Node, Value):
             1 if a new data dependency edge has been added.
         """
         return_value = 0
-        if extremity not in [el.extremity for el in self._data_dep_children]:  # Avoids duplicates
+        if extremity.id not in self._data_dep_children_ids:  # Avoids duplicates
             assert extremity.name == "Identifier"
+            if self._data_dep_children is _EMPTY_TUPLE:
+                self._data_dep_children = []
+                self._data_dep_children_ids = set()
+            self._data_dep_children_ids.add(extremity.id)
             self._data_dep_children.append(Dependence('data dependency', extremity, 'data',
                                                        nearest_statement))
+            if extremity._data_dep_parents is _EMPTY_TUPLE:
+                extremity._data_dep_parents = []
             extremity._data_dep_parents.append(Dependence('data dependency', self, 'data',
                                                           nearest_statement))
+            Identifier._data_flow_version += 1  # <== ADDED BY ME
             return_value = 1
         self.set_provenance_dd(extremity)  # Stored provenance
         return return_value
@@ -5413,17 +6672,24 @@ class Identifier(Node, Value):
         """
         prev_no_data_dep_children = len(self._data_dep_children)
 
-        self._data_dep_children = [el for el in self._data_dep_children if el.extremity != extremity]
+        if self._data_dep_children is not _EMPTY_TUPLE:
+            self._data_dep_children = [el for el in self._data_dep_children if el.extremity != extremity]
+            self._data_dep_children_ids.discard(extremity.id)
 
         # Don't forget to also remove the extremity's data dependency parent(!):
-        extremity.__data_dep_parents = [el for el in extremity._data_dep_parents if el.extremity != self]
+        if extremity._data_dep_parents is not _EMPTY_TUPLE:  # <== CHANGED BY ME: was `extremity.__data_dep_parents`,
+            # which Python mangles into `extremity._Identifier__data_dep_parents`, i.e., the parent was never removed:
+            extremity._data_dep_parents = [el for el in extremity._data_dep_parents if el.extremity != self]
 
+        Identifier._data_flow_version += 1  # <== ADDED BY ME
         return prev_no_data_dep_children - len(self._data_dep_children)  # the no. of removed data dependency children
 
 
 class ValueExpr(Node, Value):
     """ Nodes from VALUE_EXPR which therefore have a value that should be stored. """
 
+    __slots__ = _VALUE_SLOTS  # <== ADDED BY ME
+
     def __init__(self, name, parent):
         Node.__init__(self, name, parent)
         Value.__init__(self)
@@ -5432,32 +6698,44 @@ class ValueExpr(Node, Value):
 class Statement(Node):
     """ Statement Nodes, see STATEMENTS. """
 
+    __slots__ = ("control_dep_parents", "control_dep_children")  # <== ADDED BY ME
+
     def __init__(self, name, parent):
         Node.__init__(self, name, parent)
-        self.control_dep_parents = []
-        self.control_dep_children = []
+        self.control_dep_parents = _EMPTY_TUPLE  # <== CHANGED BY ME (copy-on-write)
+        self.control_dep_children = _EMPTY_TUPLE  # <== CHANGED BY ME (copy-on-write)
 
     def set_control_dependency(self, extremity, label):
+        if self.control_dep_children is _EMPTY_TUPLE:
+            self.control_dep_children = []
         self.control_dep_children.append(Dependence('control dependency', extremity, label))
         try:
+            if extremity.control_dep_parents is _EMPTY_TUPLE:
+                extremity.control_dep_parents = []
             extremity.control_dep_parents.append(Dependence('control dependency', self, label))
         except AttributeError as e:
             logging.debug('Unable to build a CF to go up the tree: %s', e)
 
     def remove_control_dependency(self, extremity):
-        for i, _ in enumerate(self.control_dep_children):
-            elt = self.control_dep_children[i]
-            if elt.extremity.id == extremity.id:
-                del self.control_dep_children[i]
-                try:
-                    del extremity.control_dep_parents[i]
-                except AttributeError as e:
-                    logging.debug('No CF going up the tree to delete: %s', e)
+        # CHANGED BY ME: the index of a Dependence in self.control_dep_children was also used to delete from
+        #                extremity.control_dep_parents (a different list!), and the list was modified while iterating
+        #                over it; each side is now filtered on its own, in a single pass (this method has no callers
+        #                in DoubleX, so no id-keyed dict is kept alongside the lists of every single Statement for it):
+        control_dep_children = [elt for elt in self.control_dep_children if elt.extremity is not extremity]
+        if len(control_dep_children) != len(self.control_dep_children):
+            self.control_dep_children = control_dep_children
+            try:
+                extremity.control_dep_parents = [elt for elt in extremity.control_dep_parents
+                                                  if elt.extremity is not self]
+            except AttributeError as e:
+                logging.debug('No CF going up the tree to delete: %s', e)
 
 
 class ReturnStatement(Statement, Value):
     """ ReturnStatement Node. It is a Statement that also has the attributes of a Value. """
 
+    __slots__ = _VALUE_SLOTS  # <== ADDED BY ME
+
     def __init__(self, name, parent):
         Statement.__init__(self, name, parent)
         Value.__init__(self)
@@ -5466,6 +6744,8 @@ class ReturnStatement(Statement, Value):
 class Function:
     """ To store function related information. """
 
+    __slots__ = ()  # <== ADDED BY ME; cf. _FUNCTION_SLOTS
+
     def __init__(self):
         self.fun_name = None
         self.fun_params = []
@@ -5483,10 +6763,9 @@ class Function:
     def add_fun_return(self, fun_return):
         # if fun_return.id not in [el.id for el in self.fun_return]:  # Avoids duplicates
         # Duplicates are okay, because we only consider the last return value from the list
-        return_id_list = [el.id for el in self.fun_return]
-        if not return_id_list:
-            self.fun_return.append(fun_return)
-        elif fun_return.id != return_id_list[-1]:  # Avoids duplicates if already considered one
+        # CHANGED BY ME: only the last return value is compared against, no need to collect all of their IDs first
+        #                (Node IDs are unique, so comparing the IDs is the same as comparing the Nodes, cf. Node.__eq__):
+        if not self.fun_return or fun_return is not self.fun_return[-1]:  # Avoids duplicates if already considered one
             self.fun_return.append(fun_return)
 
     def set_retraverse(self):
@@ -5499,6 +6778,8 @@ class Function:
 class FunctionDeclaration(Statement, Function):
     """ FunctionDeclaration Node. It is a Statement that also has the attributes of a Function. """
 
+    __slots__ = _FUNCTION_SLOTS  # <== ADDED BY ME
+
     def __init__(self, name, parent):
         Statement.__init__(self, name, parent)
         Function.__init__(self)
@@ -5507,6 +6788,8 @@ class FunctionDeclaration(Statement, Function):
 class FunctionExpression(Node, Function):
     """ FunctionExpression and ArrowFunctionExpression Nodes. Have the attributes of a Function. """
 
+    __slots__ = _FUNCTION_SLOTS + ("fun_intern_name",)  # <== ADDED BY ME
+
     def __init__(self, name, parent):
         Node.__init__(self, name, parent)
         Function.__init__(self)
@@ -49,7 +49,7 @@ def get_node_path(begin_node, destination_node, path):
             Ex: [0, 0, 1] <=> begin_node.children[0].children[0].children[1] = destination_node.
     """
 
-    if begin_node.id == destination_node.id:
+    if begin_node is destination_node:
         return True
 
     for i, _ in enumerate(begin_node.children):
@@ -19,6 +19,7 @@
 """
 
 import sys
+import gc
 import resource
 import timeit
 import logging
@@ -48,7 +49,7 @@ else:  # To run with multiprocessing
     DISPLAY_VAR = False  # To not display variable values
     CHECK_JSON = False  # To not build the JS code from the AST
 
-    NUM_WORKERS = 1  # CHANGE THIS ONE
+    NUM_WORKERS = 1  # CHANGE THIS ONE (or pass num_workers to build_pdg.store_[extension_]pdg_folder())
 
 
 class UpperThresholdFilter(logging.Filter):
@@ -107,6 +108,28 @@ def limit_memory(maxsize):
     resource.setrlimit(resource.RLIMIT_AS, (maxsize, hard))
 
 
+# ADDED BY ME:
+GC_GEN0_THRESHOLD = 10000  # Allocations between two generation-0 collections (CPython's default: 700 resp. 2000)
+
+
+# ADDED BY ME:
+def tune_gc():
+    """
+    Makes CPython's cyclic garbage collector cheaper while building PDGs, without turning it off:
+    - gc.freeze() moves all objects alive so far into the permanent generation, so that they are no longer
+      traversed by every full collection (and their pages aren't copied by forked workers touching them);
+    - the generation-0 threshold is raised to GC_GEN0_THRESHOLD as every Node is part of a reference cycle
+      (`parent` <-> `children`), i.e., the hundreds of thousands of Nodes of a large file otherwise trigger
+      a collection every few hundred/thousand allocations.
+    Affects the entire (current) process and the processes it forks afterwards, and the objects frozen are never
+    collected. Therefore opt-in only: called by the PDG folder drivers of build_pdg.py when asked to (tune_gc=True),
+    right before they start their worker processes.
+    """
+    gc.freeze()
+    gen0, gen1, gen2 = gc.get_threshold()
+    gc.set_threshold(max(gen0, GC_GEN0_THRESHOLD), gen1, gen2)
+
+
 # ADDED BY ME:
 def cross_product(xs, ys, where_either_equals=None):
     """
@@ -52,7 +52,7 @@ def display_values(var, keep_none=True, check_insecure=True, recompute=False):
         variable = get_node_value(var)
         print('\t' + variable + ' = ' + str(value))  # Prints variable = value
 
-    elif var.name in _node.CALL_EXPR + ['ReturnStatement']:
+    elif var.name in _node.CALL_EXPR_SET or var.name == 'ReturnStatement':
         print('\t' + var.name + ' = ' + str(value))  # Prints variable = value)
 
     if isinstance(value, _node.Node):
@@ -464,14 +464,8 @@ def default(o):
     Conversion of such objects into str. """
 
     if isinstance(o, (_node.ValueExpr, _node.FunctionExpression)):
-        parent = o.parent
-        while True:
-            if parent.parent:
-                parent = parent.parent
-            else:
-                break
-        if "filename" in parent.attributes:
-            filename = parent.attributes["filename"]
+        filename = o.get_file()  # <== CHANGED BY ME (was: walking up to the root and reading its "filename" attribute)
+        if filename:
             raw_code = open(filename, 'rb').read()[o.attributes['range'][0]:
                                                    o.attributes['range'][1]]
             return re.sub(' {2,}', ' ', raw_code.decode("utf8", "ignore"))
@@ -1,6 +1,63 @@
+import pickle
+import random
 import unittest
 
-from src.pdg_js.node import Node
+from src.pdg_js import build_ast
+from src.pdg_js.node import Node, Identifier, Statement, literal_type, same_id
+from src.pdg_js.node import LIMIT_SIZE, shorten_value_list, shorten_value_dict
+
+
+def recursive_shorten_value_list(value_list, value_list_shortened, counter=0):
+    """ The former, recursive implementation of shorten_value_list(), to compare against. """
+    for el in value_list:
+        if isinstance(el, list):
+            value_list_shortened.append([])
+            counter = recursive_shorten_value_list(el, value_list_shortened[-1], counter)
+            if counter >= LIMIT_SIZE:
+                return counter
+        elif isinstance(el, str):
+            counter += len(el)
+            if counter < LIMIT_SIZE:
+                value_list_shortened.append(el)
+        else:
+            counter += len(str(el))
+            if counter < LIMIT_SIZE:
+                value_list_shortened.append(el)
+    return counter
+
+
+def recursive_shorten_value_dict(value_dict, value_dict_shortened, counter=0, visited=None):
+    """ The former, recursive implementation of shorten_value_dict(), to compare against. """
+    if visited is None:
+        visited = set()
+    if id(value_dict) in visited:
+        return counter
+    visited.add(id(value_dict))
+
+    for k, v in value_dict.items():
+        if isinstance(k, str):
+            counter += len(k)
+        if isinstance(v, list):
+            value_dict_shortened[k] = []
+            counter = recursive_shorten_value_list(v, value_dict_shortened[k], counter)
+            if counter >= LIMIT_SIZE:
+                return counter
+        elif isinstance(v, dict):
+            value_dict_shortened[k] = {}
+            if id(v) in visited:
+                return counter
+            counter = recursive_shorten_value_dict(v, value_dict_shortened[k], counter, visited)
+            if counter >= LIMIT_SIZE:
+                return counter
+        elif isinstance(v, str):
+            counter += len(v)
+            if counter < LIMIT_SIZE:
+                value_dict_shortened[k] = v
+        else:
+            counter += len(str(v))
+            if counter < LIMIT_SIZE:
+                value_dict_shortened[k] = v
+    return counter
 
 
 class TestNodeClass(unittest.TestCase):
@@ -234,6 +291,26 @@ class TestNodeClass(unittest.TestCase):
         self.assertFalse(pdg_order1.matches(pdg_order2, allow_different_child_order=False, **args))
         self.assertFalse(pdg_order2.matches(pdg_order1, allow_different_child_order=False, **args))
 
+        # Test allow_different_child_order argument with 3, 4 and with 8 children:
+        for no_children in [3, 4, 8]:
+            pdg_in_order = Node("ArrayExpression")
+            pdg_reversed = Node("ArrayExpression")
+            pdg_different = Node("ArrayExpression")
+            for i in range(no_children):
+                pdg_in_order.child(Node("Literal", attributes={"raw": str(i), "value": i}))
+                pdg_reversed.child(Node("Literal", attributes={"raw": str(no_children-1-i), "value": no_children-1-i}))
+                pdg_different.child(Node("Literal", attributes={"raw": str(i+1), "value": i+1}))
+            self.assertTrue(pdg_in_order.matches(pdg_reversed, allow_different_child_order=True, **args))
+            self.assertFalse(pdg_in_order.matches(pdg_reversed, allow_different_child_order=False, **args))
+            self.assertFalse(pdg_in_order.matches(pdg_different, allow_different_child_order=True, **args))
+            # The first two children in reverse order match with allow_additional_children=True:
+            pattern = Node("ArrayExpression")\
+                .child(Node("Literal", attributes={"raw": "1", "value": 1}))\
+                .child(Node("Literal", attributes={"raw": "0", "value": 0}))
+            args_additional_children = dict(args, allow_additional_children=True)
+            self.assertTrue(pdg_in_order.matches(pattern, allow_different_child_order=True, **args_additional_children))
+            self.assertFalse(pdg_in_order.matches(pattern, allow_different_child_order=False, **args_additional_children))
+
     def test_string_literal_without_quotation_marks(self):
         literal1 = Node("Literal", attributes={"raw": "'Hello World'", "value": "Hello World"})
         literal2 = Node("Literal", attributes={"raw": "\"Hello World\"", "value": "Hello World"})
@@ -281,6 +358,19 @@ class TestNodeClass(unittest.TestCase):
         self.assertTrue(pdg.any_string_literal_inside_contains_regex("Hello"))
         self.assertFalse(pdg.any_string_literal_inside_contains_regex("'Hello"))
 
+    def test_any_literals_inside_match_regexes(self):
+        pdg = Node("BinaryExpression", attributes={"operator": "+"})
+        pdg.child(Node("Literal", attributes={"raw": "'Hello World'", "value": "Hello World"}))
+        pdg.child(Node("Literal", attributes={"raw": "3.14", "value": 3.14}))
+        self.assertEqual(pdg.any_literals_inside_match_regexes([r"Hello", r"\d\.\d\d", r"'Hello.*'"],
+                                                               full=False, string_literals_only=False),
+                         {r"Hello": True, r"\d\.\d\d": True, r"'Hello.*'": True})
+        self.assertEqual(pdg.any_literals_inside_match_regexes([r"Hello", r"Hello World", r"'Hello World'"],
+                                                               full=True, string_literals_only=True),
+                         {r"Hello": False, r"Hello World": True, r"'Hello World'": False})
+        self.assertEqual(pdg.any_literals_inside_match_regexes([r"\d"], full=False, string_literals_only=True),
+                         {r"\d": False})
+
     def test_get_height(self):
         pdg = Node("Program")
         self.assertEqual(pdg.get_height(), 1)
@@ -300,6 +390,102 @@ class TestNodeClass(unittest.TestCase):
                 )
         self.assertEqual(pdg.get_height(), 3)
 
+    def test_get_all_and_get_literal_raw(self):
+        # "[1, [2, 3], x]":
+        pdg = Node("ArrayExpression")\
+                .child(Node("Literal", attributes={"raw": "1", "value": 1}))\
+                .child(
+                    Node("ArrayExpression")
+                        .child(Node("Literal", attributes={"raw": "2", "value": 2}))
+                        .child(Node("Literal", attributes={"raw": "3", "value": 3}))
+                )\
+                .child(Node("Identifier", attributes={"name": "x"}))
+        # get_all() returns the Nodes in pre-order:
+        self.assertEqual([lit.attributes['raw'] for lit in pdg.get_all("Literal")], ["1", "2", "3"])
+        self.assertEqual(pdg.get_all("ArrayExpression"), [pdg, pdg.children[1]])
+        self.assertEqual(pdg.get_all("Identifier"), [pdg.children[2]])
+        self.assertEqual(pdg.get_all("CallExpression"), [])
+        self.assertEqual(list(pdg.get_all_as_iter("Literal")), pdg.get_all("Literal"))
+        # get_literal_raw() returns the first Literal (in pre-order):
+        self.assertEqual(pdg.get_literal_raw(), "1")
+        self.assertEqual(pdg.children[1].get_literal_raw(), "2")
+        self.assertIsNone(pdg.children[2].get_literal_raw())
+        self.assertTrue(pdg.contains_literal())
+        self.assertTrue(pdg.children[1].contains_literal())
+        self.assertFalse(pdg.children[2].contains_literal())
+
+    def test_get_all_after_tree_changes(self):
+        # get_all() uses an index that has to be invalidated whenever the tree changes:
+        pdg = Node("ArrayExpression")\
+                .child(Node("Literal", attributes={"raw": "1", "value": 1}))
+        inner = Node("ArrayExpression")
+        self.assertEqual(len(pdg.get_all("Literal")), 1)
+        self.assertEqual(inner.get_all("Literal"), [])
+        self.assertFalse(inner.contains_literal())
+
+        # Adding to the tree:
+        self.assertEqual(pdg.get_child_names(), ("Literal",))
+        pdg.child(inner)
+        self.assertEqual(pdg.get_child_names(), ("Literal", "ArrayExpression"))
+        self.assertEqual(pdg.get_all("ArrayExpression"), [pdg, inner])
+        inner.child(Node("Literal", attributes={"raw": "2", "value": 2}))
+        self.assertEqual([lit.attributes['raw'] for lit in pdg.get_all("Literal")], ["1", "2"])
+        self.assertEqual([lit.attributes['raw'] for lit in inner.get_all("Literal")], ["2"])
+        self.assertEqual(inner.get_literal_raw(), "2")
+
+        # Moving a subtree to the front of another Node:
+        [literal1, _inner] = pdg.children
+        literal1.adopt_child(step_daddy=inner)
+        self.assertEqual(pdg.children, [inner])
+        self.assertEqual([lit.attributes['raw'] for lit in inner.get_all("Literal")], ["1", "2"])
+        self.assertEqual(pdg.get_child_names(), ("ArrayExpression",))
+        self.assertEqual(inner.get_child_names(), ("Literal", "Literal"))
+        self.assertEqual(inner.get_child_name_counts()["Literal"], 2)
+        self.assertEqual(inner.get_sorted_child_names(), ("Literal", "Literal"))
+        self.assertEqual(pdg.get_literal_raw(), "1")
+
+    def test_child(self):
+        expression = Node("BinaryExpression", attributes={"operator": "+"}) \
+            .child(Node("Literal", attributes={"raw": "1", "value": 1})) \
+            .child(Node("Literal", attributes={"raw": "2", "value": 2}))
+        self.assertEqual(len(expression.children), 2)
+        self.assertEqual(expression.children[1].parent, expression)
+        with self.assertRaises(TypeError):
+            expression.child(Node("Literal", attributes={"raw": "3", "value": 3}))
+        with self.assertRaises(TypeError):
+            Node("UnaryExpression", attributes={"operator": "!"}) \
+                .child(Node("Identifier", attributes={"name": "x"})) \
+                .child(Node("Identifier", attributes={"name": "y"}))
+        # There is no limit for other Nodes:
+        array = Node("ArrayExpression")
+        for i in range(10):
+            array.child(Node("Literal", attributes={"raw": str(i), "value": i}))
+        self.assertEqual(len(array.children), 10)
+
+    def test_is_inside_after_tree_changes(self):
+        x = Node("Identifier", attributes={"name": "x"})
+        expression = Node("BinaryExpression", attributes={"operator": "+"}) \
+            .child(x) \
+            .child(Node("Literal", attributes={"raw": "1", "value": 1}))
+        self.assertFalse(x.is_inside_return_statement())
+        self.assertFalse(x.is_inside_a(["ReturnStatement", "IfStatement"]))
+
+        return_statement = Node("ReturnStatement").child(expression)
+        self.assertTrue(x.is_inside_return_statement())
+        self.assertTrue(return_statement.is_inside_return_statement())
+        self.assertTrue(x.is_inside_a(["ReturnStatement"]))
+        self.assertTrue(x.is_inside_a(["IfStatement", "ReturnStatement"]))
+        self.assertFalse(x.is_inside_a(["IfStatement"]))
+        self.assertFalse(return_statement.is_inside_a(["ReturnStatement"]))
+
+        block = Node("BlockStatement")
+        expression.adopt_child(step_daddy=block)
+        self.assertFalse(x.is_inside_return_statement())
+        self.assertFalse(x.is_inside_a(["ReturnStatement"]))
+        Node("IfStatement").child(Node("Identifier", attributes={"name": "y"})).child(block)
+        self.assertTrue(x.is_inside_a(["IfStatement"]))
+        self.assertTrue(x.is_inside_a(["IfStatement", "BlockStatement"]))
+
     def test_get_sibling_by_name(self):
         expression = Node("BinaryExpression", attributes={"operator": "+"}) \
             .child(Node("Literal", attributes={"raw": "'x'", "value": "x"})) \
@@ -476,5 +662,274 @@ class TestNodeClass(unittest.TestCase):
         self.assertFalse(literal1.is_lhs_of_a("UnaryExpression", allow_missing_rhs=False))
 
 
+    def test_set_value_shortens_long_values(self):
+        identifier = Identifier("Identifier", None)
+
+        # Short values are stored as they are:
+        short_value = [1, "foo", {"bar": [None, True, 4.2]}]
+        identifier.set_value(short_value)
+        self.assertIs(identifier.value, short_value)
+
+        # A dict inside a list counts as len(str(dict)), whose escaping makes it longer than its JSON serialization
+        # (6013 characters), i.e., this value is too long and has to be shortened:
+        long_value = [{'a': '"' + "'" * 6000}]
+        identifier.set_value(long_value)
+        self.assertEqual(identifier.value, [])
+
+
+    def test_remove_control_dependency(self):
+        a, b, c, d, e = (Statement("ExpressionStatement", None) for _ in range(5))
+        d.set_control_dependency(c, "e")
+        e.set_control_dependency(c, "e")
+        a.set_control_dependency(b, "e")
+        a.set_control_dependency(c, "e")
+        # c is a's 2nd control dependency child, but a is c's 3rd control dependency parent:
+        self.assertEqual([dep.extremity for dep in a.control_dep_children], [b, c])
+        self.assertEqual([dep.extremity for dep in c.control_dep_parents], [d, e, a])
+
+        a.remove_control_dependency(c)
+        self.assertEqual([dep.extremity for dep in a.control_dep_children], [b])
+        self.assertEqual([dep.extremity for dep in c.control_dep_parents], [d, e])
+        self.assertEqual([dep.extremity for dep in b.control_dep_parents], [a])
+        self.assertEqual([dep.extremity for dep in d.control_dep_children], [c])
+        self.assertEqual([dep.extremity for dep in e.control_dep_children], [c])
+
+        # Removing a control dependency that doesn't exist (anymore) changes nothing:
+        a.remove_control_dependency(c)
+        d.remove_control_dependency(b)
+        self.assertEqual([dep.extremity for dep in a.control_dep_children], [b])
+        self.assertEqual([dep.extremity for dep in c.control_dep_parents], [d, e])
+        self.assertEqual([dep.extremity for dep in b.control_dep_parents], [a])
+
+
+    def test_literal_type(self):
+        self.assertEqual(literal_type(Node("Literal", attributes={"raw": "true", "value": True})), "Bool")
+        self.assertEqual(literal_type(Node("Literal", attributes={"raw": "false", "value": False})), "Bool")
+        self.assertEqual(literal_type(Node("Literal", attributes={"raw": "1", "value": 1})), "Int")
+        self.assertEqual(literal_type(Node("Literal", attributes={"raw": "1.5", "value": 1.5})), "Numeric")
+        self.assertEqual(literal_type(Node("Literal", attributes={"raw": '"s"', "value": "s"})), "String")
+        self.assertEqual(literal_type(Node("Literal", attributes={"raw": "null", "value": None})), "Null")
+        self.assertEqual(literal_type(Node("Literal", attributes={"raw": "/a+/g", "value": {},
+                                                                  "regex": {"pattern": "a+", "flags": "g"}})),
+                         "RegExp")
+
+
+    def test_subtree_queries_after_modification(self):
+        program = Node("Program")
+        block = Node("BlockStatement")
+        program.child(Node("IfStatement").child(block))
+        block.child(Node("Identifier", attributes={"name": "a"}))
+        self.assertEqual(len(program.get_all("Identifier")), 1)  # (indexes the tree)
+
+        # Querying a subtree of a modified tree walks that subtree instead of re-indexing the entire tree:
+        block.child(Node("Identifier", attributes={"name": "b"}))
+        self.assertEqual([identifier.attributes["name"] for identifier in block.get_all("Identifier")], ["a", "b"])
+        self.assertEqual(len(block.get_all_identifiers_by_name("b")), 1)
+        self.assertEqual(block.get_subtree_size(), 3)
+        self.assertTrue(block.children[1].is_inside_a(["IfStatement"]))
+        self.assertIsNone(block._get_indexed_root())
+
+        # Querying the root (re-)indexes the tree:
+        self.assertEqual(len(program.get_all("Identifier")), 2)
+        self.assertIs(block._get_indexed_root(), program)
+
+
+    def test_identity_equality(self):
+        identifier1 = Node("Identifier", attributes={"name": "foo"})
+        identifier2 = Node("Identifier", attributes={"name": "foo"})
+        self.assertEqual(identifier1, identifier1)
+        self.assertNotEqual(identifier1, identifier2)  # (equivalent() but not the same Node)
+        self.assertNotEqual(identifier1, None)
+        self.assertEqual(len({identifier1, identifier2, identifier1}), 2)
+        d = {identifier1: 1, identifier2: 2}
+        self.assertEqual(d[identifier1], 1)
+        self.assertEqual(d[identifier2], 2)
+
+        # An (un)pickled copy is a different Node, with the same ID though:
+        program = Node("Program").child(Node("ExpressionStatement").child(identifier1))
+        program_copy = pickle.loads(pickle.dumps(program))
+        identifier1_copy = program_copy.children[0].children[0]
+        self.assertNotEqual(identifier1_copy, identifier1)
+        self.assertNotIn(identifier1_copy, {identifier1})
+        self.assertTrue(same_id(identifier1_copy, identifier1))
+        self.assertTrue(same_id(program_copy, program))
+        self.assertFalse(same_id(identifier1_copy, identifier2))
+        self.assertFalse(same_id(identifier1, None))
+        self.assertTrue(same_id(None, None))
+
+
+    def test_get_file(self):
+        ast = {"type": "Program", "filename": "foo.js",
+               "body": [{"type": "ExpressionStatement",
+                         "expression": {"type": "CallExpression", "arguments": [],
+                                        "callee": {"type": "Identifier", "name": "foo"}}}]}
+        program = build_ast.ast_to_ast_nodes(ast, ast_nodes=Node("Program"))
+        leaf = program.get_all_identifiers()[0]
+        self.assertEqual(leaf.attributes["name"], "foo")
+        self.assertEqual(leaf.get_file(), "foo.js")
+        self.assertEqual(program.get_file(), "foo.js")
+
+        # A Node moved into another tree belongs to the file of that tree:
+        other_ast = {"type": "Program", "filename": "bar.js", "body": []}
+        other_program = build_ast.ast_to_ast_nodes(other_ast, ast_nodes=Node("Program"))
+        expression_statement = program.children[0]
+        expression_statement.adopt_child(step_daddy=other_program)
+        self.assertEqual(leaf.get_file(), "bar.js")
+        self.assertEqual(Node("Identifier").get_file(), "")
+
+
+    @staticmethod
+    def _identifiers(*names):
+        identifiers = []
+        for name in names:
+            identifier = Identifier("Identifier", None)
+            identifier.attributes["name"] = name
+            identifiers.append(identifier)
+        return identifiers
+
+    def test_data_flow_searches_with_cycles(self):
+        # a --data--> b --data--> c --data--> a, d --data--> c, e has no data flows at all:
+        a, b, c, d, e = self._identifiers("a", "b", "c", "d", "e")
+        a.set_data_dependency(b)
+        b.set_data_dependency(c)
+        c.set_data_dependency(a)
+        d.set_data_dependency(c)
+
+        self.assertEqual(a.data_flow_distance_to(a), 0)
+        self.assertEqual(a.data_flow_distance_to(b), 1)
+        self.assertEqual(a.data_flow_distance_to(c), 2)
+        self.assertEqual(c.data_flow_distance_to(b), 2)
+        self.assertEqual(d.data_flow_distance_to(b), 3)
+        self.assertEqual(a.data_flow_distance_to(d), float("inf"))  # (unreachable, despite the cycle)
+        self.assertEqual(a.data_flow_distance_to(e), float("inf"))
+        self.assertEqual(e.data_flow_distance_to(a), float("inf"))
+
+        self.assertEqual(a.get_data_flow_parents(), {a, b, c, d})
+        self.assertEqual(a.get_data_flow_parents(max_depth=1), {a, c})
+        self.assertEqual(a.get_data_flow_parents(max_depth=2), {a, b, c, d})
+        self.assertEqual(d.get_data_flow_parents(), {d})
+        self.assertEqual(e.get_data_flow_parents(), {e})
+
+        self.assertTrue(a.is_data_flow_equivalent_identifier(b))
+        self.assertTrue(b.is_data_flow_equivalent_identifier(d))
+        self.assertFalse(b.is_data_flow_equivalent_identifier(d, max_depth=1))  # (c is 2 edges away from b)
+        self.assertFalse(a.is_data_flow_equivalent_identifier(b, max_depth=0))
+        self.assertFalse(a.is_data_flow_equivalent_identifier(e))
+        self.assertFalse(e.is_data_flow_equivalent_identifier(a))
+
+    def test_data_flow_searches_after_modification(self):
+        x, y, z = self._identifiers("x", "y", "z")
+        x.set_data_dependency(y)
+
+        # Fill the caches first (is_data_flow_equivalent_identifier() uses them once both sides are cached):
+        self.assertEqual(y.get_data_flow_parents(), {x, y})
+        self.assertEqual(z.get_data_flow_parents(), {z})
+        self.assertFalse(y.is_data_flow_equivalent_identifier(z))
+        self.assertEqual(z.data_flow_distance_to(y), float("inf"))
+
+        # A new data flow edge z --data--> x has to be taken into account by all of them:
+        z.set_data_dependency(x)
+        self.assertEqual(y.get_data_flow_parents(), {x, y, z})
+        self.assertEqual(x.get_data_flow_parents(), {x, z})
+        self.assertTrue(y.is_data_flow_equivalent_identifier(z))
+        self.assertEqual(z.data_flow_distance_to(y), 2)
+
+        # ...until it's removed again:
+        self.assertEqual(z.remove_data_dependency(x), 1)
+        self.assertEqual(y.get_data_flow_parents(), {x, y})
+        self.assertEqual(x.get_data_flow_parents(), {x})
+        self.assertFalse(y.is_data_flow_equivalent_identifier(z))
+        self.assertEqual(z.data_flow_distance_to(y), float("inf"))
+
+        # The set returned is a copy, modifying it doesn't affect the cache:
+        y.get_data_flow_parents().add(z)
+        self.assertEqual(y.get_data_flow_parents(), {x, y})
+
+
+    def assert_shortened_like_before(self, value):
+        if isinstance(value, list):
+            shortened, expected_shortened = [], []
+            counter = shorten_value_list(value, shortened)
+            expected_counter = recursive_shorten_value_list(value, expected_shortened)
+        else:
+            shortened, expected_shortened = {}, {}
+            counter = shorten_value_dict(value, shortened)
+            expected_counter = recursive_shorten_value_dict(value, expected_shortened)
+        self.assertEqual(shortened, expected_shortened)
+        # (past LIMIT_SIZE, the remaining elements aren't measured anymore, so the counter is only exact below it):
+        self.assertEqual(counter >= LIMIT_SIZE, expected_counter >= LIMIT_SIZE)
+        if expected_counter < LIMIT_SIZE:
+            self.assertEqual(counter, expected_counter)
+        return shortened, counter
+
+    def test_shorten_value_at_limit_size(self):
+        for delta in (-2, -1, 0, 1):
+            n = LIMIT_SIZE + delta
+            self.assert_shortened_like_before(["x" * n])
+            self.assert_shortened_like_before([[["x" * (n - 3)], "abc"], "d"])
+            self.assert_shortened_like_before([["x" * (n - 1)], [1]])
+            self.assert_shortened_like_before({"k": "x" * (n - 1)})
+            self.assert_shortened_like_before({"k": {"l": ["x" * (n - 2)], "m": 7}, "n": "y"})
+            self.assert_shortened_like_before([{"k": "x" * (n - 5)}, "z"])  # (a dict inside a list is len(str(...)))
+            self.assert_shortened_like_before([1.5, None, True, ["x" * (n - 12)], "abcdef"])
+
+    def test_shorten_value_counter_carried_over_between_siblings(self):
+        # The 3rd sibling list pushes the counter (carried over from its 2 siblings) over LIMIT_SIZE:
+        shortened, counter = self.assert_shortened_like_before(
+            [["a" * 6000], ["b" * (LIMIT_SIZE - 6001)], ["c" * 2], ["d"]])
+        self.assertEqual(shortened, [["a" * 6000], ["b" * (LIMIT_SIZE - 6001)], []])
+        self.assertGreaterEqual(counter, LIMIT_SIZE)
+
+        shortened, counter = self.assert_shortened_like_before(
+            {"a": ["x" * 5000], "b": {"c": "y" * (LIMIT_SIZE - 5004)}, "d": ["z"], "e": "end"})
+        self.assertEqual(shortened, {"a": ["x" * 5000], "b": {"c": "y" * (LIMIT_SIZE - 5004)}, "d": []})
+        self.assertGreaterEqual(counter, LIMIT_SIZE)
+
+        # Values that are short enough are kept entirely:
+        shortened, counter = self.assert_shortened_like_before([["a" * 100], {"b": 1}, ["c", ["d"]], "e"])
+        self.assertEqual(shortened, [["a" * 100], {"b": 1}, ["c", ["d"]], "e"])
+        self.assertEqual(counter, 100 + len("{'b': 1}") + 3)
+
+        # Randomly nested values around LIMIT_SIZE:
+        rng = random.Random(0)
+
+        def random_value(depth=0):
+            r = rng.random()
+            if depth < 4 and r < 0.25:
+                return [random_value(depth + 1) for _ in range(rng.randint(0, 5))]
+            elif depth < 4 and r < 0.45:
+                return {rng.choice(["k" + str(i), "x" * 50 + str(i), i]): random_value(depth + 1)
+                        for i in range(rng.randint(0, 5))}
+            return rng.choice(["s" * rng.randint(0, LIMIT_SIZE // 3), 42, 4.2, None, True, (1, "t")])
+
+        for _ in range(300):
+            value = random_value()
+            if isinstance(value, (list, dict)):
+                self.assert_shortened_like_before(value)
+
+    def test_shorten_value_self_references(self):
+        # A dict containing itself is only traversed once, just like before:
+        d = {"a": "x"}
+        d["self"] = d
+        d["b"] = "y"
+        shortened, _ = self.assert_shortened_like_before(d)
+        self.assertEqual(shortened, {"a": "x", "self": {}})
+
+        # A dict shared by two keys is only traversed the first time:
+        shared = {"s": "t"}
+        shortened, _ = self.assert_shortened_like_before({"a": shared, "b": shared, "c": "z"})
+        self.assertEqual(shortened, {"a": {"s": "t"}, "b": {}})
+
+        # A list containing itself used to raise a RecursionError; it's now treated like a non-list element:
+        lst = ["x"]
+        lst.append(lst)
+        shortened = []
+        counter = shorten_value_list(lst, shortened)
+        self.assertEqual(counter, 1 + len(str(lst)))
+        self.assertEqual(len(shortened), 2)
+        self.assertEqual(shortened[0], "x")
+        self.assertIs(shortened[1], lst)
+
+
 if __name__ == '__main__':
     unittest.main()